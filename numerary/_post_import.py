@@ -0,0 +1,157 @@
+# ======================================================================================
+# Copyright and other protections apply. Please see the accompanying LICENSE file for
+# rights and restrictions governing use of this software. All rights not expressly
+# waived or licensed are reserved. If that file is missing or appears to be modified
+# from its original, then please contact the author before viewing or using this
+# software in any capacity.
+# ======================================================================================
+
+from __future__ import annotations
+
+import logging
+import sys
+import traceback
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from threading import Lock
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+__all__ = ("when_imported",)
+
+
+# ---- Types ---------------------------------------------------------------------------
+
+
+_HookT = Callable[[ModuleType], None]
+
+
+# ---- Classes -------------------------------------------------------------------------
+
+
+class _HookedLoader(Loader):
+    r"""
+    Stands in for the loader of a module with pending hooks (without modifying it,
+    since it may be shared with other modules) until the module is executed, and then
+    runs the hooks.
+    """
+
+    def __init__(self, spec: ModuleSpec, loader: Any):
+        self._spec = spec
+        self._loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        create_module = getattr(self._loader, "create_module", None)
+
+        return None if create_module is None else create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Put the real loader back where the import machinery left us so that neither
+        # the module nor anything inspecting it afterward sees us
+        self._spec.loader = self._loader
+
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+
+        self._loader.exec_module(module)
+        _run_hooks(self._spec.name, module)
+
+
+class _PostImportFinder(MetaPathFinder):
+    r"""
+    A meta path finder that defers to the rest of ``#!python sys.meta_path`` to find
+    modules with pending hooks, but arranges for those hooks to run once the module has
+    been executed.
+    """
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if fullname not in _hooks:
+            return None
+
+        for finder in list(sys.meta_path):
+            find_spec = getattr(finder, "find_spec", None)
+
+            if finder is self or find_spec is None:
+                continue
+
+            spec = find_spec(fullname, path, target)
+
+            if spec is not None:
+                break
+        else:
+            return None
+
+        # Loaders that only implement the deprecated load_module can't be intercepted,
+        # so they're left alone
+        if hasattr(spec.loader, "exec_module"):
+            spec.loader = _HookedLoader(spec, spec.loader)
+
+        return spec
+
+
+# ---- Functions -----------------------------------------------------------------------
+
+
+def when_imported(module_name: str) -> Callable[[_HookT], _HookT]:
+    r"""
+    Decorator to call the decorated function with the module named *module_name* once
+    it has been imported. If it has already been imported, the function is called
+    immediately. Exceptions raised by the function are logged rather than propagated.
+    This allows registering type-checking exceptions for third-party libraries without
+    importing them ourselves.
+    """
+
+    def _decorator(hook: _HookT) -> _HookT:
+        with _lock:
+            _hooks.setdefault(module_name, []).append(hook)
+
+            if _finder not in sys.meta_path:
+                sys.meta_path.insert(0, _finder)
+
+        module = sys.modules.get(module_name)
+
+        # Check after registering in case another thread imports the module in between
+        if module is not None:
+            _run_hooks(module_name, module)
+
+        return hook
+
+    return _decorator
+
+
+def _run_hooks(module_name: str, module: ModuleType) -> None:
+    # Modules can be imported from any thread, so hooks are claimed under the lock (but
+    # run outside of it, since they may import other modules)
+    with _lock:
+        hooks = _hooks.pop(module_name, ())
+
+        if not _hooks:
+            try:
+                sys.meta_path.remove(_finder)
+            except ValueError:
+                pass
+
+    for hook in hooks:
+        try:
+            hook(module)
+        except Exception as exc:
+            logging.getLogger(__name__).warning(
+                f"unexpected error when processing {module_name} ({exc})"
+            )
+            logging.getLogger(__name__).debug(traceback.format_exc())
+
+
+# ---- Initialization ------------------------------------------------------------------
+
+
+_hooks: Dict[str, List[_HookT]] = {}
+_lock = Lock()
+_finder = _PostImportFinder()
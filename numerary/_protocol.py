@@ -8,19 +8,75 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, Set, Tuple, Type, TypeVar
+import gc
+import json
+import os
+import sys
+import time
+import typing
+from _thread import LockType
+from abc import get_cache_token
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import singledispatch, update_wrapper
+from hashlib import blake2b, sha256
+from itertools import chain
+from threading import Lock, get_ident, local
+from types import MappingProxyType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableSet,
+    NamedTuple,
+    Optional,
+)
+from typing import Protocol as _Protocol
+from typing import Sequence, Set, Tuple, Type, TypeVar, Union
+from weakref import WeakSet, finalize, ref
 
 from beartype.typing import Protocol as _BeartypeCachingProtocol
+from beartype.typing._typingpep544 import _PROTOCOL_ATTR_NAMES_IGNORABLE
 
-__all__ = ("CachingProtocolMeta",)
+__all__ = (
+    "CachingProtocolMeta",
+    "CacheInfo",
+    "attach_shared_verdicts",
+    "batch_overrides",
+    "cached_verdicts",
+    "detach_shared_verdicts",
+    "load_cached_verdicts",
+    "protocoldispatch",
+    "register_overrides",
+    "restore_state",
+    "save_cached_verdicts",
+    "set_default_cache_maxsize",
+    "set_stats_enabled",
+    "snapshot_state",
+    "stats",
+    "warm",
+    "WarmInfo",
+    "worker_initializer",
+)
 
 
 # ---- Types ---------------------------------------------------------------------------
 
 
+_T = TypeVar("_T")
 _T_co = TypeVar("_T_co", covariant=True)
 _TT = TypeVar("_TT", bound="CachingProtocolMeta")
+_CacheT = TypeVar("_CacheT", bound=Dict)
+_MembersT = Tuple[FrozenSet[str], FrozenSet[str]]
+_OverrideT = Tuple["CachingProtocolMeta", Type, Optional[bool]]
+_MemberIndexEntryT = Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]
 
 
 if TYPE_CHECKING:
@@ -31,6 +87,380 @@ else:
     _BeartypeCachingProtocolMeta = type(_BeartypeCachingProtocol)
 
 
+class _ProtocolDispatchCallable(_Protocol[_T_co]):
+    @property
+    def registry(self) -> Mapping[Any, Callable[..., _T_co]]:
+        ...
+
+    def __call__(self, *args: Any, **kwargs: Any) -> _T_co:
+        ...
+
+    def dispatch(self, obj: Any) -> Callable[..., _T_co]:
+        ...
+
+    def register(self, key: Any, func: Optional[Callable[..., Any]] = None) -> Any:
+        ...
+
+
+class _CheckPlan(NamedTuple):
+    r"""
+    What an instance check against a protocol entails, as determined once when the
+    protocol is created. Plain ``beartype`` protocol bases are folded in, since checking
+    them amounts to checking their own bases and members. Of the rest, ``typing``
+    runtime protocols are paired with their members (see ``_typing_protocol_members``)
+    and the others (including caching protocols, which have their own caches) are
+    checked with ``#!python isinstance``. Members are all required names along with
+    those that must also not be ``#!python None`` (as PEP 544 allows for "blocking"
+    methods).
+    """
+
+    bases: Tuple[Type, ...]
+    typing_bases: Tuple[Tuple[Type, _MembersT], ...]
+    members: _MembersT
+
+
+class _DispatchCache(dict):
+    r"""
+    A dictionary mapping types to resolved implementations for a
+    [``protocoldispatch``][numerary._protocol.protocoldispatch] function. This only
+    exists so that instances can be weakly referenced (and held in sets, which requires
+    comparing by identity).
+    """
+
+    __slots__ = ("__weakref__",)
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__  # type: ignore [assignment]
+
+
+class CacheInfo(NamedTuple):
+    r"""
+    Snapshot of a caching protocol’s runtime type-checking cache as returned by
+    [``CachingProtocolMeta.cache_info``][numerary._protocol.CachingProtocolMeta.cache_info].
+    """
+
+    maxsize: Optional[int]
+    r"""
+    The maximum number of computed (i.e., non-overridden) entries retained, or
+    ``#!python None`` if unbounded.
+    """
+
+    currsize: int
+    r"""
+    The total number of entries currently cached, including pinned ones.
+    """
+
+    pinned: int
+    r"""
+    The number of entries pinned via
+    [``includes``][numerary._protocol.CachingProtocolMeta.includes] or
+    [``excludes``][numerary._protocol.CachingProtocolMeta.excludes]. These are never
+    evicted.
+    """
+
+
+class WarmInfo(NamedTuple):
+    r"""
+    Summary of a call to [``warm``][numerary._protocol.warm].
+    """
+
+    checked: int
+    r"""
+    The number of verdicts checked (i.e., the number of types times the number of
+    protocols).
+    """
+
+    computed: int
+    r"""
+    The number of those verdicts that were not already known.
+    """
+
+    elapsed: float
+    r"""
+    The time spent, in seconds.
+    """
+
+
+class _BoundedCache(OrderedDict):
+    r"""
+    A least-recently-used cache that retains at most *maxsize* entries whose keys are
+    not pinned in *pinned*. Pinned entries are never evicted and do not count against
+    *maxsize*.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        pinned: Dict[Type, bool],
+        items: Iterable[Tuple[Type, bool]] = (),
+    ):
+        self.maxsize = maxsize
+        self._pinned = pinned
+        super().__init__(items)
+
+    def __getitem__(self, key: Type) -> bool:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+
+        return value
+
+    def __setitem__(self, key: Type, value: bool) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        # Pinned entries are always also cached (and only ever recorded as True), so
+        # there's no need to scan either to count them
+        pinned = self._pinned
+        num_pinned = len(pinned)
+
+        while len(self) - num_pinned > self.maxsize:
+            try:
+                victim = next((key for key in self if not pinned.get(key)), None)
+            except RuntimeError:
+                # A lock-free hit in another thread reordered entries mid-scan
+                continue
+
+            if victim is None:
+                # Everything left is pinned, so there's nothing we're allowed to evict
+                break
+
+            self.pop(victim, None)
+
+
+class _Overlay:
+    r"""
+    Verdicts overridden via
+    [``CachingProtocolMeta.overriding``][numerary._protocol.CachingProtocolMeta.overriding]
+    for a particular context (including those of any enclosing blocks). Protocols
+    deriving from overridden ones are checked anew in light of them, and those verdicts
+    are kept here rather than in the protocols' own caches.
+    """
+
+    __slots__ = ("overridden", "computed", "__weakref__")
+
+    def __init__(
+        self,
+        parent: Optional[_Overlay],
+        overrides: Iterable[Tuple[CachingProtocolMeta, Type, bool]],
+    ):
+        self.overridden: Dict[Type, Dict[CachingProtocolMeta, bool]] = (
+            {}
+            if parent is None
+            else {
+                inst_t: dict(verdicts) for inst_t, verdicts in parent.overridden.items()
+            }
+        )
+        self.computed: Dict[Tuple[CachingProtocolMeta, Type], Tuple[int, bool]] = {}
+
+        for protocol, inst_t, verdict in overrides:
+            self.overridden.setdefault(inst_t, {})[protocol] = verdict
+
+    def verdict(self, protocol: CachingProtocolMeta, obj: Any) -> Optional[bool]:
+        # Returns None where the overlay has no bearing on the verdict
+        inst_t = type(obj)
+        verdicts = self.overridden.get(inst_t)
+
+        if verdicts is None:
+            return None
+
+        verdict = verdicts.get(protocol)
+
+        if verdict is not None:
+            return verdict
+
+        # Global overrides don't depend on bases, and neither does anything unrelated
+        # to those overridden here
+        if inst_t in protocol._abc_inst_check_cache_overridden or not any(
+            base in verdicts for base in protocol.__mro__[1:]
+        ):
+            return None
+
+        key = (protocol, inst_t)
+        generation = _generation
+        computed = self.computed.get(key)
+
+        if computed is not None and computed[0] == generation:
+            return computed[1]
+
+        verdict = protocol._compute_verdict(obj)
+        self.computed[key] = (generation, verdict)
+
+        return verdict
+
+
+class _SharedVerdictTable:
+    r"""
+    An open-addressed hash table of verdicts in a shared memory segment (see
+    [``attach_shared_verdicts``][numerary._protocol.attach_shared_verdicts]). After a
+    two-word header, each slot is a 64-bit word. All but its lowest two bits hold a key
+    derived from the names of a protocol (along with a hash of its members) and a type,
+    which are the same in every process. The lowest two bits hold the verdict (``0b11``
+    if affirmative, ``0b01`` if not, and ``0b00`` if forgotten). Slots are only ever
+    written whole, so concurrent writers can at worst displace each other's entries,
+    which just means checking again.
+    """
+
+    __slots__ = ("shm", "attached", "words", "slots")
+
+    def __init__(self, shm: Any, slots: Optional[int] = None):
+        self.shm = shm
+        self.attached = slots is None
+        self.words = shm.buf.cast("Q")
+
+        if slots is not None:
+            self.words[1] = slots
+            self.words[0] = _SHARED_MAGIC
+        elif len(self.words) < 2 or self.words[0] != _SHARED_MAGIC or not self.words[1]:
+            self.close()
+
+            raise ValueError(f"{shm.name} does not contain a verdict table")
+
+        self.slots: int = self.words[1]
+
+    def close(self) -> None:
+        self.words.release()
+        self.shm.close()
+
+    def get(self, protocol: CachingProtocolMeta, inst_t: Type) -> Optional[bool]:
+        # Must be called while holding _lock
+        key = _shared_key(protocol, inst_t, shielded=True)
+
+        if key is None:
+            return None
+
+        index = self._slot(key)
+
+        if index is None:
+            return None
+
+        word = self.words[index]
+
+        return bool(word & 0b10) if word & 0b01 else None
+
+    def put(
+        self, protocol: CachingProtocolMeta, inst_t: Type, verdict: Optional[bool]
+    ) -> None:
+        # Must be called while holding _lock. A verdict of None forgets any verdict
+        # from any process.
+        key = _shared_key(protocol, inst_t, shielded=verdict is not None)
+
+        if key is None:
+            return
+
+        index = self._slot(key)
+
+        # If there's no room nearby, the verdict just isn't shared
+        if index is not None and (verdict is not None or self.words[index]):
+            self.words[index] = key if verdict is None else key | 0b01 | verdict << 1
+
+    def _slot(self, key: int) -> Optional[int]:
+        # Returns the index of the word holding key, or of the first empty one where it
+        # could go, or None if there is neither nearby
+        words = self.words
+        slots = self.slots
+        start = key % slots
+
+        for offset in range(min(_SHARED_MAX_PROBES, slots)):
+            index = 2 + (start + offset) % slots
+            word = words[index]
+
+            if not word or word & ~0b11 == key:
+                return index
+
+        return None
+
+
+_caching_protocols: WeakSet = WeakSet()
+_beartype_protocols: WeakSet = WeakSet()
+_beartype_stashes: Dict[Type, Dict[int, Tuple[ref, Any, bool]]] = {}
+_type_keyed_caches: List[Dict[Type, Any]] = []
+_type_keyed_stashes: List[Tuple[Dict[Type, Any], Dict[int, Tuple[ref, Any, bool]]]] = []
+_default_cache_maxsize: Optional[int] = None
+
+# Each caching protocol is assigned an index into _protocols_by_index upon creation.
+# _verdicts maps each type checked against any caching protocol to a bitmask where,
+# for a protocol with index i, bit 2i is set if the verdict is known and bit 2i + 1 is
+# set if it is also affirmative. Per-protocol caches remain the fast path, but they
+# can be bounded (or evicted) without losing verdicts, which are retrieved from here
+# on a miss. _verdicts itself is bounded only by the number of (live) types checked,
+# since it holds exactly one int for each. Indexes of collected protocols are reused
+# (see _assign_index), so neither _protocols_by_index nor the bitmasks outgrow the
+# number of caching protocols alive at once. _protocols_epoch changes whenever an
+# index is assigned.
+_protocols_by_index: List[ref] = []
+_protocols_epoch = 0
+_verdicts: Dict[Type, int] = {}
+_verdicts_stash: Optional[Dict[int, Tuple[ref, Any, bool]]] = None
+_KNOWN = 0b01
+_SUPPORTED = 0b10
+
+# See <https://docs.python.org/3/c-api/typeobj.html#Py_TPFLAGS_HEAPTYPE>
+_Py_TPFLAGS_HEAPTYPE = 1 << 9
+
+# Cache hits never lock. Everything else that reads or writes shared state (caches,
+# overrides, listeners, and the verdict table) holds _lock, but never while running
+# structural checks or other arbitrary code. Misses are single-flight: the first thread
+# to miss on a particular protocol and type computes the verdict while others wait on
+# its lock in _in_flight. Overrides bump the generation of the overridden protocol and
+# of every protocol deriving from it (directly or not) so that verdicts computed
+# concurrently with them are returned but not cached. They also bump _generation, which
+# guards resolutions cached by protocoldispatch functions.
+_lock = Lock()
+_in_flight: Dict[Tuple[Any, Type], Tuple[LockType, int]] = {}
+_generation = 0
+_gc_stashed = False
+
+# Overrides made within batch_overrides blocks are collected here (per thread) until
+# the outermost block exits
+_batching = local()
+
+# Overlays created via CachingProtocolMeta.overriding, which are visible only in the
+# context where they were created (and those copied from it, e.g., by asyncio tasks).
+# CachingProtocolMeta.__instancecheck__ is swapped for a version that consults the
+# current context's overlay only while any exist, so hits cost nothing extra otherwise.
+# _overlaid mirrors whether that version is installed. _release_pending is set where
+# an overlay was finalized while the lock was held, so that the next check through that
+# version can swap it back out.
+_overlay: ContextVar[Optional[_Overlay]] = ContextVar("numerary_overlay", default=None)
+_live_overlays: List[ref] = []
+_overlaid = False
+_release_pending = False
+
+# Computed verdicts are also shared with other processes via _shared_verdicts while a
+# table is attached (see attach_shared_verdicts)
+_shared_verdicts: Optional[_SharedVerdictTable] = None
+_shared_keys: Dict[Type, Tuple[Optional[str], Dict[int, int]]] = {}
+_SHARED_MAGIC = int.from_bytes(b"numerary", "little")
+_SHARED_MAX_PROBES = 16
+_SHARED_ATTACH_TIMEOUT = 5.0  # seconds
+
+_IGNORABLE_BASE_NAMES = frozenset(("Generic", "object", "Protocol"))
+_MISSING: Any = object()
+
+# _member_index maps each type whose instances have been checked to sets of the member
+# names probed, those absent, and those that are None (i.e., "blocked" as PEP 544
+# allows for methods). It is shared by all caching protocols, so each name is probed at
+# most once per type no matter how many protocols require it, and each protocol's
+# members are then just a containment test. _static_member_index is the same, but for
+# lookups that bypass descriptors (as typing does as of Python 3.12).
+_member_index: Dict[Type, _MemberIndexEntryT] = {}
+_static_member_index: Dict[Type, _MemberIndexEntryT] = {}
+_EMPTY_MEMBER_INDEX_ENTRY: _MemberIndexEntryT = (frozenset(), frozenset(), frozenset())
+
+# Resolutions cached by protocoldispatch functions depend on verdicts, so all of them
+# are cleared whenever an override changes any verdict
+_dispatch_caches: WeakSet = WeakSet()
+
+# Statistics are off by default. Turning them on swaps in a counting version of
+# CachingProtocolMeta.__instancecheck__ (see set_stats_enabled), so hits cost nothing
+# extra otherwise.
+_stats_enabled = False
+_STATS_KEYS = ("hits", "misses", "override_hits", "invalidations")
+_HITS, _MISSES, _OVERRIDE_HITS, _INVALIDATIONS = range(len(_STATS_KEYS))
+
+
 class CachingProtocolMeta(_BeartypeCachingProtocolMeta):
     # TODO(posita): Add more precise link to beartype.typing.Protocol documentation once
     # it becomes available.
@@ -38,10 +468,35 @@ class CachingProtocolMeta(_BeartypeCachingProtocolMeta):
     An extension of [``#!python
     beartype.typing.Protocol``](https://github.com/beartype/beartype) that allows
     overriding runtime checks.
+
+    Caching protocols are safe to share among threads. Cache hits do not lock. The
+    first thread to miss on a particular type performs the structural check while any
+    others checking the same type wait for its verdict rather than repeating it.
+    Overrides (e.g., via
+    [``includes``][numerary._protocol.CachingProtocolMeta.includes]) are serialized
+    and take precedence over verdicts computed concurrently with them.
+
+    Computed verdicts are shared among caching protocols where one follows from
+    another. A type found to satisfy a protocol also satisfies any other caching
+    protocol requiring nothing more (e.g., a ``RationalLike`` type is also
+    ``RealLike``), so those are recorded too (unless already known). Likewise, a type
+    that fails such a component protocol fails any protocol requiring more without
+    being checked again.
     """
 
+    _abc_inst_check_index: int
     _abc_inst_check_cache_overridden: Dict[Type, bool]
-    _abc_inst_check_cache_listeners: Set[CachingProtocolMeta]
+    _abc_inst_check_cache_listeners: MutableSet[CachingProtocolMeta]
+    _abc_inst_check_generation: int
+    _abc_inst_check_cache_maxsize: Optional[int]
+    _abc_inst_check_cache_weakkeys: bool
+    _abc_inst_check_cache_stash: Optional[Dict[int, Tuple[ref, Any, bool]]]
+    _abc_inst_check_stats: List[int]
+    _abc_inst_check_plan: _CheckPlan
+    _abc_inst_check_requirements: FrozenSet[Any]
+    _abc_inst_check_components: Tuple[int, Tuple[int, ...]]
+    _abc_inst_check_caching_bases: Tuple[CachingProtocolMeta, ...]
+    _abc_inst_check_shared_ident: Optional[str]
 
     # Defined in beartype.typing.Protocol from which we inherit
     _abc_inst_check_cache: Dict[type, bool]
@@ -58,15 +513,293 @@ class CachingProtocolMeta(_BeartypeCachingProtocolMeta):
         # Prefixing this class member with "_abc_" is necessary to prevent it from being
         # considered part of the Protocol. (See
         # <https://github.com/python/cpython/blob/main/Lib/typing.py>.)
-        cls._abc_inst_check_cache_overridden = defaultdict(bool)  # defaults to False
-        cls._abc_inst_check_cache_listeners = set()
+        cls._abc_inst_check_cache_overridden = {}
+        cls._abc_inst_check_cache_listeners = WeakSet()
+        cls._abc_inst_check_generation = 0
+        cls._abc_inst_check_cache_maxsize = None
+        cls._abc_inst_check_cache_weakkeys = True
+        cls._abc_inst_check_cache_stash = None
+        cls._abc_inst_check_stats = [0] * len(_STATS_KEYS)
+        cls._abc_inst_check_plan = _check_plan(cls)
+        cls._abc_inst_check_requirements = _plan_requirements(cls._abc_inst_check_plan)
+        cls._abc_inst_check_components = (0, ())
+        cls._abc_inst_check_caching_bases = tuple(
+            base for base in cls.__mro__ if isinstance(base, CachingProtocolMeta)
+        )
+        cls._abc_inst_check_shared_ident = None
+
+        with _lock:
+            cls._abc_inst_check_index = _assign_index(cls)
 
-        for base in bases:
-            if hasattr(base, "_abc_inst_check_cache_listeners"):
-                base._abc_inst_check_cache_listeners.add(cls)
+            for base in bases:
+                if hasattr(base, "_abc_inst_check_cache_listeners"):
+                    base._abc_inst_check_cache_listeners.add(cls)
+
+            _caching_protocols.add(cls)
+
+            for base in cls.__mro__[1:]:
+                if "_abc_inst_check_cache" in base.__dict__ and not isinstance(
+                    base, CachingProtocolMeta
+                ):
+                    _beartype_protocols.add(base)
+
+            if _default_cache_maxsize is not None:
+                cls._set_cache_maxsize(_default_cache_maxsize)
 
         return cls
 
+    def set_cache_maxsize(cls, maxsize: Optional[int]) -> None:
+        r"""
+        Bounds the runtime type-checking cache to at most *maxsize* computed entries,
+        evicting the least recently used ones first. Entries pinned via
+        [``includes``][numerary._protocol.CachingProtocolMeta.includes] or
+        [``excludes``][numerary._protocol.CachingProtocolMeta.excludes] are never
+        evicted and do not count against *maxsize*. A *maxsize* of ``#!python None``
+        (the default) removes the bound.
+
+        Evicted verdicts are retained in a compact table shared by all caching
+        protocols (see [``cached_verdicts``][numerary._protocol.cached_verdicts]), so
+        they are restored cheaply the next time they are needed. This means even small
+        bounds avoid repeating structural checks. That table is not subject to
+        *maxsize*. It holds a single integer for each type checked against any caching
+        protocol for as long as that type exists.
+
+        ``` python
+        >>> from abc import abstractmethod
+        >>> from numerary.types import CachingProtocolMeta, Protocol, runtime_checkable
+
+        >>> @runtime_checkable
+        ... class SupportsEggs(
+        ...   Protocol,
+        ...   metaclass=CachingProtocolMeta
+        ... ):
+        ...   @abstractmethod
+        ...   def eggs(self) -> str:
+        ...     pass
+
+        >>> SupportsEggs.set_cache_maxsize(2)
+        >>> SupportsEggs.excludes(str)
+        >>> for val in (0, 0.0, 0j):
+        ...   _ = isinstance(val, SupportsEggs)
+        >>> SupportsEggs.cache_info()
+        CacheInfo(maxsize=2, currsize=3, pinned=1)
+
+        ```
+
+        See also
+        [``set_default_cache_maxsize``][numerary._protocol.set_default_cache_maxsize].
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative or None (not {maxsize})")
+
+        with _lock:
+            cls._set_cache_maxsize(maxsize)
+
+    def __instancecheck__(cls, obj: Any) -> bool:
+        try:
+            # This is intentionally identical to beartype's hit path. Anything else
+            # belongs in _inst_check_miss.
+            return cls._abc_inst_check_cache[type(obj)]
+        except KeyError:
+            return cls._inst_check_miss(obj)
+
+    _inst_check_uncounted = __instancecheck__
+
+    def set_cache_weakkeys(cls, weakkeys: bool) -> None:
+        r"""
+        Controls whether the runtime type-checking cache allows otherwise unreferenced
+        classes to be garbage collected (the default). This includes classes registered
+        via [``includes``][numerary._protocol.CachingProtocolMeta.includes] or
+        [``excludes``][numerary._protocol.CachingProtocolMeta.excludes].
+
+        ``` python
+        >>> import gc, weakref
+        >>> from numerary.types import RealLike
+        >>> MyFloat = type("MyFloat", (float,), {})
+        >>> isinstance(MyFloat(), RealLike)
+        True
+        >>> my_float_ref = weakref.ref(MyFloat)
+        >>> del MyFloat
+        >>> _ = gc.collect()
+        >>> my_float_ref() is None
+        True
+
+        ```
+
+        Cache hits always use the class itself as a key, so hits are just as fast
+        either way. Instead, strong references to heap types (i.e., those that can be
+        garbage collected) are temporarily removed from the cache for the duration of
+        each full garbage collection. Survivors are restored afterward.
+        """
+        cls._abc_inst_check_cache_weakkeys = weakkeys
+
+    def check_many(cls, values: Iterable[Any]) -> Sequence[bool]:
+        r"""
+        Returns whether each of *values* is an instance of this protocol. This is
+        equivalent to ``#!python [isinstance(value, cls) for value in values]``, but
+        consults the cache only once per distinct type. If *values* is a ``numpy``
+        array, the result is a boolean array of the same shape.
+
+        ``` python
+        >>> from decimal import Decimal
+        >>> from numerary import RealLike
+        >>> RealLike.check_many([1, 2.0, Decimal(3), 4j, 5])
+        [True, True, True, False, True]
+
+        ```
+        """
+        numpy = _numpy()
+
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.dtype.kind == "O":
+                verdicts_flat = cls.check_many(values.flat)
+
+                return numpy.array(verdicts_flat, dtype=bool).reshape(values.shape)
+            else:
+                # All elements share the dtype's scalar type
+                return numpy.full(values.shape, cls._check_dtype(values.dtype))
+
+        verdicts_by_type: Dict[Type, bool] = {}
+        verdicts: List[bool] = []
+        append = verdicts.append
+
+        for value in values:
+            value_t = type(value)
+
+            try:
+                append(verdicts_by_type[value_t])
+            except KeyError:
+                verdict = verdicts_by_type[value_t] = isinstance(value, cls)
+                append(verdict)
+
+        return verdicts
+
+    def check_all(cls, values: Iterable[Any]) -> bool:
+        r"""
+        Returns whether all of *values* are instances of this protocol, stopping at the
+        first that is not. This is equivalent to ``#!python all(isinstance(value, cls)
+        for value in values)``, but consults the cache only once per distinct type.
+
+        ``` python
+        >>> from numerary import RealLike
+        >>> RealLike.check_all([1, 2.0, 3])
+        True
+        >>> RealLike.check_all(iter([1, 2j, 3]))
+        False
+
+        ```
+        """
+        supported_ts: Set[Type] = set()
+
+        for value in values:
+            value_t = type(value)
+
+            if value_t not in supported_ts:
+                if not isinstance(value, cls):
+                    return False
+
+                supported_ts.add(value_t)
+
+        return True
+
+    def check_array(cls, values: Any) -> bool:
+        r"""
+        Returns whether all elements of the ``numpy`` array *values* are instances of
+        this protocol. *values* may also be a ``numpy`` dtype, in which case the answer
+        applies to any array of that dtype.
+
+        Because all elements of an array share its dtype’s scalar type, this requires
+        only a single (usually cached) check, regardless of the array’s size. Arrays
+        with the ``#!python object`` dtype are the exception, since their elements can
+        be of any type. Those are scanned via
+        [``check_all``][numerary._protocol.CachingProtocolMeta.check_all]. (The
+        ``#!python object`` dtype alone is therefore insufficient and raises a
+        ``#!python ValueError``.)
+
+        ``` python
+        >>> import numpy
+        >>> from numerary import IntegralLike, RealLike
+        >>> RealLike.check_array(numpy.zeros((1000, 1000), dtype=numpy.float32))
+        True
+        >>> IntegralLike.check_array(numpy.dtype(numpy.float32))
+        False
+        >>> IntegralLike.check_array(numpy.array([1, numpy.int8(2)], dtype=object))
+        True
+
+        ```
+        """
+        numpy = _numpy()
+
+        if numpy is not None and isinstance(values, numpy.dtype):
+            if values.kind == "O":
+                raise ValueError(
+                    "object dtypes say nothing about elements (provide an array)"
+                )
+
+            return cls._check_dtype(values)
+        elif numpy is not None and isinstance(values, numpy.ndarray):
+            if values.dtype.kind == "O":
+                return cls.check_all(values.flat)
+            else:
+                return cls._check_dtype(values.dtype)
+        else:
+            raise TypeError(f"expected a numpy array or dtype (not {values!r})")
+
+    def cache_info(cls) -> CacheInfo:
+        r"""
+        Returns a [``CacheInfo``][numerary._protocol.CacheInfo] describing the bound and
+        current occupancy of the runtime type-checking cache.
+        """
+        with _lock:
+            return CacheInfo(
+                maxsize=cls._abc_inst_check_cache_maxsize,
+                currsize=len(cls._abc_inst_check_cache),
+                pinned=len(cls._abc_inst_check_cache_overridden),
+            )
+
+    def cache_stats(cls, reset: bool = False) -> Dict[str, int]:
+        r"""
+        Returns a dictionary of runtime type-checking statistics collected while
+        statistics are enabled (see
+        [``set_stats_enabled``][numerary._protocol.set_stats_enabled]):
+
+        * ``#!python "hits"`` – checks answered directly from the cache;
+        * ``#!python "misses"`` – checks that were not (i.e., that either restored an
+          evicted verdict or performed a structural check);
+        * ``#!python "override_hits"`` – hits on verdicts registered via
+          [``includes``][numerary._protocol.CachingProtocolMeta.includes] or
+          [``excludes``][numerary._protocol.CachingProtocolMeta.excludes] (a subset of
+          ``#!python "hits"``);
+        * ``#!python "invalidations"`` – cached verdicts discarded because an override
+          was registered or reset on a protocol from which this one derives; and
+        * ``#!python "currsize"`` – the number of entries currently cached.
+
+        If *reset* is ``#!python True``, counters are zeroed after they are read.
+        Counters are updated without locking, so they are approximate when the same
+        protocol is checked from multiple threads at once.
+
+        ``` python
+        >>> from numerary.types import RealLike, set_stats_enabled
+        >>> set_stats_enabled(True)
+        >>> _ = RealLike.cache_stats(reset=True)
+        >>> for _ in range(3):
+        ...   _ = isinstance(1.0, RealLike)
+        >>> stats = RealLike.cache_stats()
+        >>> stats["hits"] + stats["misses"]
+        3
+        >>> set_stats_enabled(False)
+
+        ```
+        """
+        stats = cls._abc_inst_check_stats
+        snapshot = dict(zip(_STATS_KEYS, stats))
+        snapshot["currsize"] = len(cls._abc_inst_check_cache)
+
+        if reset:
+            stats[:] = [0] * len(_STATS_KEYS)
+
+        return snapshot
+
     def includes(cls, inst_t: Type) -> None:
         r"""
         Registers *inst_t* as supporting the interface in the runtime type-checking cache.
@@ -105,9 +838,7 @@ class CachingProtocolMeta(_BeartypeCachingProtocolMeta):
 
             ```
         """
-        cls._abc_inst_check_cache[inst_t] = True
-        cls._abc_inst_check_cache_overridden[inst_t] = True
-        cls._dirty_for(inst_t)
+        cls._override(inst_t, True)
 
     def excludes(cls, inst_t: Type) -> None:
         r"""
@@ -148,24 +879,1833 @@ class CachingProtocolMeta(_BeartypeCachingProtocolMeta):
 
             ```
         """
-        cls._abc_inst_check_cache[inst_t] = False
-        cls._abc_inst_check_cache_overridden[inst_t] = True
-        cls._dirty_for(inst_t)
+        cls._override(inst_t, False)
 
     def reset_for(cls, inst_t: Type) -> None:
         r"""
         Clears any cached instance check for *inst_t*.
         """
-        if inst_t in cls._abc_inst_check_cache:
-            del cls._abc_inst_check_cache[inst_t]
-            del cls._abc_inst_check_cache_overridden[inst_t]
-            cls._dirty_for(inst_t)
+        _change_overrides(((cls, inst_t, None),))
 
-    def _dirty_for(cls, inst_t: Type) -> None:
-        for inheriting_cls in cls._abc_inst_check_cache_listeners:
-            if (
-                inst_t in inheriting_cls._abc_inst_check_cache
-                and not inheriting_cls._abc_inst_check_cache_overridden[inst_t]
-            ):
-                del inheriting_cls._abc_inst_check_cache[inst_t]
-                del inheriting_cls._abc_inst_check_cache_overridden[inst_t]
+    @contextmanager
+    def overriding(
+        cls,
+        include: Iterable[Type] = (),
+        exclude: Iterable[Type] = (),
+    ) -> Iterator[None]:
+        r"""
+        Context manager that registers each of *include* as supporting this protocol
+        and each of *exclude* as not supporting it, as if by
+        [``includes``][numerary._protocol.CachingProtocolMeta.includes] and
+        [``excludes``][numerary._protocol.CachingProtocolMeta.excludes], but only for
+        the duration of the block, and only within the current context (see
+        [``contextvars``](https://docs.python.org/3/library/contextvars.html)). Other
+        threads and asyncio tasks are unaffected, except for tasks created within the
+        block, which inherit its overrides. This is useful where one request, tenant,
+        or test should not affect others running concurrently. Blocks can be nested
+        (including for different protocols), in which case the innermost override for
+        a particular protocol and type applies.
+
+        ``` python
+        >>> from numerary import RealLike
+        >>> class Quantity(float):
+        ...   pass
+        >>> with RealLike.overriding(exclude=[Quantity]):
+        ...   isinstance(Quantity(1.5), RealLike)
+        False
+        >>> isinstance(Quantity(1.5), RealLike)
+        True
+
+        ```
+
+        Protocols deriving from this one are checked anew for overridden types within
+        the block. Those verdicts are kept apart from (and never replace) cached ones.
+        Global overrides (e.g., via
+        [``includes``][numerary._protocol.CachingProtocolMeta.includes]) of protocols
+        deriving from this one take precedence, just as they would over global
+        overrides of this one. Functions that report on cached verdicts (e.g.,
+        [``cached_verdicts``][numerary._protocol.cached_verdicts]) ignore overlays.
+
+        While any such block is open (in any context), instance checks cost slightly
+        more, even where no overrides apply. Otherwise, they cost nothing extra.
+        """
+        include = tuple(include)
+        exclude = tuple(exclude)
+        both = set(include).intersection(exclude)
+
+        if both:
+            raise ValueError(
+                f"cannot both include and exclude {', '.join(repr(inst_t) for inst_t in both)}"
+            )
+
+        overlay = _Overlay(
+            _overlay.get(),
+            [(cls, inst_t, True) for inst_t in include]
+            + [(cls, inst_t, False) for inst_t in exclude],
+        )
+
+        with _lock:
+            _live_overlays.append(ref(overlay))
+            _install_instancecheck()
+
+        # Contexts copied from this one (e.g., by tasks) may outlive the block, so the
+        # swap is undone only once no overlays remain
+        finalize(overlay, _release_overlays, False)
+        token = _overlay.set(overlay)
+        del overlay
+
+        try:
+            yield
+        finally:
+            _overlay.reset(token)
+            _release_overlays()
+
+    def _override(cls, inst_t: Type, verdict: bool) -> None:
+        _change_overrides(((cls, inst_t, verdict),))
+
+    def _inst_check_counted(cls, obj: Any) -> bool:
+        # Swapped in for __instancecheck__ by set_stats_enabled
+        inst_t = type(obj)
+
+        try:
+            verdict = cls._abc_inst_check_cache[inst_t]
+        except KeyError:
+            cls._abc_inst_check_stats[_MISSES] += 1
+
+            return cls._inst_check_miss(obj)
+
+        cls._abc_inst_check_stats[_HITS] += 1
+
+        # Only overridden types have entries, so this is cheaper than .get()
+        if inst_t in cls._abc_inst_check_cache_overridden:
+            cls._abc_inst_check_stats[_OVERRIDE_HITS] += 1
+
+        return verdict
+
+    def _inst_check_overlaid(cls, obj: Any) -> bool:
+        # Swapped in for __instancecheck__ while any overlays exist (see overriding)
+        if _release_pending:
+            _release_overlays(False)
+
+        overlay = _overlay.get()
+
+        if overlay is not None and type(obj) in overlay.overridden:
+            verdict = overlay.verdict(cls, obj)
+
+            if verdict is not None:
+                return verdict
+
+        if _stats_enabled:
+            return cls._inst_check_counted(obj)
+        else:
+            return cls._inst_check_uncounted(obj)
+
+    def _check_dtype(cls, dtype: Any) -> bool:
+        if not _overlaid:
+            try:
+                return cls._abc_inst_check_cache[dtype.type]
+            except KeyError:
+                pass
+
+        # Let the usual machinery determine the verdict from a representative scalar
+        return isinstance(_numpy_zero(dtype), cls)
+
+    def _set_cache_maxsize(cls, maxsize: Optional[int]) -> None:
+        if maxsize is None:
+            cls._abc_inst_check_cache = dict(cls._abc_inst_check_cache)
+        else:
+            cls._abc_inst_check_cache = _BoundedCache(
+                maxsize,
+                cls._abc_inst_check_cache_overridden,
+                cls._abc_inst_check_cache.items(),
+            )
+
+        cls._abc_inst_check_cache_maxsize = maxsize
+
+    def _inst_check_miss(cls, obj: Any) -> bool:
+        inst_t = type(obj)
+        stash = cls._abc_inst_check_cache_stash
+
+        if stash:
+            # We're in the middle of a full garbage collection (e.g., a finalizer is
+            # performing this check), so weakly held cache entries are parked in the
+            # stash
+            stashed = stash.get(id(inst_t))
+
+            if stashed is not None and stashed[0]() is inst_t:
+                return stashed[1]
+
+        key = (cls, inst_t)
+
+        while True:
+            with _lock:
+                verdict = cls._abc_inst_check_cache.get(inst_t)
+
+                if verdict is None:
+                    verdict = cls._known_verdict(inst_t)
+
+                    if verdict is None and cls._component_failed(inst_t):
+                        verdict = False
+                        cls._record_verdict(inst_t, verdict)
+
+                    if verdict is None and _shared_verdicts is not None:
+                        verdict = _shared_verdicts.get(cls, inst_t)
+
+                        if verdict is not None:
+                            cls._record_verdict(inst_t, verdict)
+
+                    if verdict is not None:
+                        cls._abc_inst_check_cache[inst_t] = verdict
+
+                if verdict is not None:
+                    return verdict
+
+                in_flight = _in_flight.get(key)
+
+                if in_flight is None:
+                    # Held until the verdict is in (a bare lock is much cheaper to
+                    # create than an Event, which matters because most checks never
+                    # have anyone waiting on them)
+                    done = Lock()
+                    done.acquire()
+                    _in_flight[key] = (done, get_ident())
+                    generation = cls._abc_inst_check_generation
+
+                    break
+
+            if in_flight[1] == get_ident():
+                # This very check is already underway further up our own stack (e.g.,
+                # via an attribute lookup that performs it), so waiting would deadlock
+                return cls._compute_verdict(obj)
+
+            in_flight[0].acquire()
+            in_flight[0].release()
+
+        try:
+            verdict = cls._compute_verdict(obj)
+        except BaseException:
+            with _lock:
+                del _in_flight[key]
+
+            done.release()
+
+            raise
+
+        with _lock:
+            del _in_flight[key]
+
+            if generation == cls._abc_inst_check_generation:
+                cls._abc_inst_check_cache[inst_t] = verdict
+                cls._record_verdict(inst_t, verdict)
+
+                if _shared_verdicts is not None:
+                    _shared_verdicts.put(cls, inst_t, verdict)
+
+                if verdict:
+                    cls._seed_components(inst_t)
+
+        done.release()
+
+        return verdict
+
+    def _compute_verdict(cls, obj: Any) -> bool:
+        # This is equivalent to beartype.typing.Protocol.__instancecheck__'s miss path,
+        # but leaves caching to the caller (see _plan_admits)
+        return _plan_admits(cls._abc_inst_check_plan, obj)
+
+    def _components(cls) -> Tuple[int, ...]:
+        # Returns the indexes of other caching protocols whose requirements are a
+        # subset of ours. Whatever they require, we do, so their computed verdicts must
+        # be affirmative if ours is, and ours must be negative if any of theirs is.
+        # This includes protocols that aren't our bases (e.g., RationalLike requires
+        # everything RealLike does). Must be called while holding _lock.
+        epoch, components = cls._abc_inst_check_components
+
+        if epoch != _protocols_epoch:
+            requirements = cls._abc_inst_check_requirements
+            found: List[int] = []
+
+            for index, protocol_ref in enumerate(_protocols_by_index):
+                protocol = protocol_ref()
+
+                if (
+                    protocol is not None
+                    and protocol is not cls
+                    and protocol._abc_inst_check_requirements <= requirements
+                ):
+                    found.append(index)
+
+            components = tuple(found)
+            cls._abc_inst_check_components = (_protocols_epoch, components)
+
+        return components
+
+    def _component_failed(cls, inst_t: Type) -> bool:
+        # Must be called while holding _lock
+        bits = _verdict_bits(inst_t)
+
+        if not bits:
+            return False
+
+        for index in cls._components():
+            if (bits >> (2 * index)) & (_KNOWN | _SUPPORTED) == _KNOWN:
+                protocol = _protocols_by_index[index]()
+
+                # Overridden verdicts say nothing about requirements
+                if (
+                    protocol is not None
+                    and not protocol._abc_inst_check_cache_overridden.get(inst_t)
+                ):
+                    return True
+
+        return False
+
+    def _seed_components(cls, inst_t: Type) -> None:
+        # Must be called while holding _lock
+        for index in cls._components():
+            protocol = _protocols_by_index[index]()
+
+            # Anything already known (including explicit overrides) is left alone
+            if protocol is not None and protocol._known_verdict(inst_t) is None:
+                protocol._abc_inst_check_cache[inst_t] = True
+                protocol._record_verdict(inst_t, True)
+
+    def _depends_on_override(cls, inst_t: Type) -> bool:
+        # Whether our verdict for inst_t is (or may have been computed in light of) an
+        # override of ours or of one of our caching bases, which are specific to this
+        # process
+        for base in cls._abc_inst_check_caching_bases:
+            if base._abc_inst_check_cache_overridden.get(inst_t):
+                return True
+
+        return False
+
+    def _known_verdict(cls, inst_t: Type) -> Optional[bool]:
+        bits = _verdict_bits(inst_t) >> (2 * cls._abc_inst_check_index)
+
+        return bool(bits & _SUPPORTED) if bits & _KNOWN else None
+
+    def _record_verdict(cls, inst_t: Type, verdict: Optional[bool]) -> None:
+        shift = 2 * cls._abc_inst_check_index
+        bits = _verdict_bits(inst_t) & ~((_KNOWN | _SUPPORTED) << shift)
+
+        if verdict is not None:
+            bits |= (_KNOWN | _SUPPORTED if verdict else _KNOWN) << shift
+
+        if _verdicts_stash:
+            # Whatever was parked for the current garbage collection (including other
+            # protocols' verdicts) is merged in, so what's left in the stash is stale
+            _verdicts_stash.pop(id(inst_t), None)
+
+        if bits:
+            _verdicts[inst_t] = bits
+        else:
+            _verdicts.pop(inst_t, None)
+
+    def _stash_weakkeys(cls) -> None:
+        if cls._abc_inst_check_cache_weakkeys:
+            cls._abc_inst_check_cache_stash = _stash_heap_types(
+                cls._abc_inst_check_cache, cls._abc_inst_check_cache_overridden
+            )
+
+    def _unstash_weakkeys(cls) -> None:
+        stash = cls._abc_inst_check_cache_stash
+        cls._abc_inst_check_cache_stash = None
+
+        if stash:
+            _unstash_heap_types(
+                cls._abc_inst_check_cache, cls._abc_inst_check_cache_overridden, stash
+            )
+
+    def _unstash_for(cls, inst_t: Type) -> None:
+        if cls._abc_inst_check_cache_stash:
+            cls._abc_inst_check_cache_stash.pop(id(inst_t), None)
+
+
+# ---- Functions -----------------------------------------------------------------------
+
+
+def set_default_cache_maxsize(maxsize: Optional[int]) -> None:
+    r"""
+    Applies [``CachingProtocolMeta.set_cache_maxsize``][numerary._protocol.CachingProtocolMeta.set_cache_maxsize]
+    to every existing caching protocol and makes *maxsize* the default for those
+    created afterward. This replaces any prior per-protocol setting.
+    """
+    global _default_cache_maxsize
+
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"maxsize must be non-negative or None (not {maxsize})")
+
+    with _lock:
+        _default_cache_maxsize = maxsize
+
+        for protocol in list(_caching_protocols):
+            protocol._set_cache_maxsize(maxsize)
+
+
+def set_stats_enabled(enabled: bool) -> None:
+    r"""
+    Turns collection of runtime type-checking statistics on or off for all caching
+    protocols. Collection is off by default, in which case cache hits incur no
+    additional overhead. When on, each hit costs a few additional dictionary operations.
+    Counters are retained while collection is off. See
+    [``stats``][numerary._protocol.stats].
+    """
+    global _stats_enabled
+
+    with _lock:
+        _stats_enabled = enabled
+        _install_instancecheck()
+
+
+def stats(reset: bool = False) -> Dict[CachingProtocolMeta, Dict[str, int]]:
+    r"""
+    Returns a dictionary mapping each caching protocol to its
+    [``CachingProtocolMeta.cache_stats``][numerary._protocol.CachingProtocolMeta.cache_stats].
+    If *reset* is ``#!python True``, all counters are zeroed after they are read (e.g.,
+    to export deltas at regular intervals).
+
+    ``` python
+    >>> from numerary.types import RealLike, set_stats_enabled, stats
+    >>> set_stats_enabled(True)
+    >>> _ = isinstance(1.0, RealLike)
+    >>> sorted(stats(reset=True)[RealLike])
+    ['currsize', 'hits', 'invalidations', 'misses', 'override_hits']
+    >>> set_stats_enabled(False)
+
+    ```
+    """
+    return {
+        protocol: protocol.cache_stats(reset) for protocol in list(_caching_protocols)
+    }
+
+
+def register_overrides(
+    types: Union[Type, Iterable[Type]],
+    include: Iterable[CachingProtocolMeta] = (),
+    exclude: Iterable[CachingProtocolMeta] = (),
+) -> None:
+    r"""
+    Registers each of *types* (a type or an iterable of types) as supporting each
+    protocol in *include* and as not supporting each protocol in *exclude*, as if by
+    calling [``includes``][numerary._protocol.CachingProtocolMeta.includes] and
+    [``excludes``][numerary._protocol.CachingProtocolMeta.excludes] for each. All of
+    them take effect at once, and cached verdicts of protocols deriving from those
+    overridden are invalidated in a single pass.
+
+    ``` python
+    >>> from decimal import Decimal
+    >>> from fractions import Fraction
+    >>> from numerary.types import SupportsFloorCeil, SupportsIntegralOps, register_overrides
+    >>> register_overrides(
+    ...   (Decimal, Fraction), include=[SupportsFloorCeil], exclude=[SupportsIntegralOps]
+    ... )
+    >>> isinstance(Fraction(1, 2), SupportsIntegralOps)
+    False
+    >>> for protocol in (SupportsFloorCeil, SupportsIntegralOps):
+    ...   protocol.reset_for(Decimal)
+    ...   protocol.reset_for(Fraction)
+
+    ```
+    """
+    _change_overrides(_override_changes(types, include, exclude))
+
+
+@contextmanager
+def batch_overrides() -> Iterator[None]:
+    r"""
+    Context manager that defers overrides made by the current thread (via
+    [``includes``][numerary._protocol.CachingProtocolMeta.includes],
+    [``excludes``][numerary._protocol.CachingProtocolMeta.excludes],
+    [``reset_for``][numerary._protocol.CachingProtocolMeta.reset_for], or
+    [``register_overrides``][numerary._protocol.register_overrides]) until it exits,
+    at which point all of them take effect at once (in the order they were made), and
+    cached verdicts of protocols deriving from those overridden are invalidated in a
+    single pass. This is much cheaper than applying each one individually when
+    registering many types (e.g., at startup). Checks within the block do not yet
+    reflect its overrides. If the block raises an exception, they are discarded.
+    Nested blocks are part of the outermost one.
+
+    ``` python
+    >>> from numerary.types import SupportsRealOps, batch_overrides
+    >>> class Quantity(float):
+    ...   pass
+    >>> with batch_overrides():
+    ...   SupportsRealOps.excludes(Quantity)
+    ...   isinstance(Quantity(1.5), SupportsRealOps)  # not yet
+    True
+    >>> isinstance(Quantity(1.5), SupportsRealOps)
+    False
+    >>> SupportsRealOps.reset_for(Quantity)
+
+    ```
+    """
+    if getattr(_batching, "changes", None) is not None:
+        yield
+
+        return
+
+    changes: List[_OverrideT] = []
+    _batching.changes = changes
+
+    try:
+        yield
+    finally:
+        _batching.changes = None
+
+    with _lock:
+        _apply_overrides(changes)
+
+
+def warm(
+    types: Iterable[Any], protocols: Optional[Iterable[CachingProtocolMeta]] = None
+) -> WarmInfo:
+    r"""
+    Determines verdicts for each of *types* against each of *protocols* (all caching
+    protocols if ``#!python None``), so that later checks are cache hits. This is
+    meant to be called during startup (e.g., before reporting readiness), and does not
+    rely on ``#!python assert`` statements (which are stripped under ``python -O``).
+
+    Structural checks require an instance. Each member of *types* may be either an
+    instance (used as is) or a type, in which case one is created by calling it with
+    ``#!python 0`` (or with no arguments if that fails). A ``#!python TypeError`` is
+    raised if that does not produce an instance of exactly that type, in which case an
+    instance should be provided instead (e.g., ``#!python sympy.Integer(2)`` rather
+    than ``#!python sympy.Integer``, since ``#!python sympy.Integer(0)`` is an instance
+    of ``#!python sympy.core.numbers.Zero``).
+
+    ``` python
+    >>> from decimal import Decimal
+    >>> from numerary.types import RealLike, SupportsFloat, warm
+    >>> info = warm((int, float, Decimal(1)), (RealLike, SupportsFloat))
+    >>> info.checked
+    6
+    >>> info.elapsed >= 0.0
+    True
+
+    ```
+    """
+    start = time.perf_counter()
+    samples = [_sample(t) for t in types]
+    checked = computed = 0
+
+    if protocols is None:
+        protocols = list(_caching_protocols)
+
+    for protocol in protocols:
+        for sample in samples:
+            if protocol._known_verdict(type(sample)) is None:
+                computed += 1
+
+            isinstance(sample, protocol)
+            checked += 1
+
+    return WarmInfo(
+        checked=checked, computed=computed, elapsed=time.perf_counter() - start
+    )
+
+
+def cached_verdicts(inst_t: Type) -> Dict[CachingProtocolMeta, bool]:
+    r"""
+    Returns a dictionary mapping each caching protocol with a known verdict for *inst_t*
+    to that verdict. This requires only a single lookup in the table shared by all
+    caching protocols. Protocols whose verdicts for *inst_t* have yet to be determined
+    are omitted.
+
+    ``` python
+    >>> from numerary.types import RealLike, SupportsFloat, cached_verdicts
+    >>> isinstance(1.0, RealLike)
+    True
+    >>> verdicts = cached_verdicts(float)
+    >>> verdicts[RealLike], verdicts[SupportsFloat]
+    (True, True)
+
+    ```
+    """
+    verdicts: Dict[CachingProtocolMeta, bool] = {}
+
+    with _lock:
+        bits = _verdict_bits(inst_t)
+
+    index = 0
+
+    while bits:
+        if bits & _KNOWN:
+            protocol = _protocols_by_index[index]()
+
+            if protocol is not None:
+                verdicts[protocol] = bool(bits & _SUPPORTED)
+
+        bits >>= 2
+        index += 1
+
+    return verdicts
+
+
+def save_cached_verdicts(path: Union[str, os.PathLike]) -> int:
+    r"""
+    Writes computed verdicts from all caching protocols to *path* so that they can be
+    restored in another process (e.g., at startup) via
+    [``load_cached_verdicts``][numerary._protocol.load_cached_verdicts]. Returns the
+    number of verdicts written.
+
+    Verdicts are keyed by the fully qualified names of the protocol and the checked
+    type. Each protocol is accompanied by a hash of its members (including those of the
+    protocols from which it derives), and the file as a whole is tagged with the
+    ``numerary`` version. Overrides registered via
+    [``includes``][numerary._protocol.CachingProtocolMeta.includes] or
+    [``excludes``][numerary._protocol.CachingProtocolMeta.excludes] are not written,
+    nor are verdicts of protocols deriving from those overridden for the same type.
+    Neither are verdicts for protocols or types that cannot be found by name (e.g.,
+    those defined inside functions).
+
+    The file is replaced atomically, so concurrent writers (e.g., multiple workers
+    during a rolling deploy) do not corrupt it.
+    """
+    snapshot, num_written = _snapshot(overrides=False)
+
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.{get_ident()}.tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+
+    os.replace(tmp_path, path)
+
+    return num_written
+
+
+def load_cached_verdicts(path: Union[str, os.PathLike]) -> int:
+    r"""
+    Restores verdicts written by
+    [``save_cached_verdicts``][numerary._protocol.save_cached_verdicts] from *path*
+    and returns the number restored.
+
+    ``` python
+    >>> import os, tempfile
+    >>> from numerary.types import (
+    ...   RealLike, cached_verdicts, load_cached_verdicts, save_cached_verdicts,
+    ... )
+    >>> isinstance(1.0, RealLike)
+    True
+    >>> with tempfile.TemporaryDirectory() as tmp_dir:
+    ...   path = os.path.join(tmp_dir, "numerary-verdicts.json")
+    ...   _ = save_cached_verdicts(path)
+    ...   RealLike.reset_for(float)
+    ...   _ = load_cached_verdicts(path)
+    >>> cached_verdicts(float)[RealLike]
+    True
+
+    ```
+
+    Verdicts are silently skipped if the file was written by a different ``numerary``
+    version, if a protocol’s members have changed, or if a protocol or type cannot be
+    found. Types are only looked up among already-imported modules. Nothing is
+    imported as a result of loading, so this should be called after importing any
+    modules whose types are of interest. Verdicts that are already known (including
+    overrides) take precedence over those loaded. Verdicts are also skipped for types
+    overridden for any caching protocol from which the saved one derives.
+    """
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+
+    return _restore(saved)
+
+
+def snapshot_state() -> Dict[str, Any]:
+    r"""
+    Returns a snapshot of the state of all caching protocols, including overrides
+    (e.g., via [``includes``][numerary._protocol.CachingProtocolMeta.includes]),
+    computed verdicts, and cache bounds, which can be restored in another process via
+    [``restore_state``][numerary._protocol.restore_state]. The snapshot consists only
+    of dictionaries, lists, strings, numbers, and ``#!python None``, so it can be
+    pickled (e.g., to pass it to worker processes) or serialized as JSON. Protocols
+    and types are identified by name, as with
+    [``save_cached_verdicts``][numerary._protocol.save_cached_verdicts], so those that
+    cannot be found by name (e.g., those defined inside functions) are omitted.
+
+    This is mainly useful with the ``spawn`` and ``forkserver`` start methods of
+    ``multiprocessing``, where workers import ``numerary`` anew rather than inheriting
+    whatever state the parent built at runtime. See
+    [``worker_initializer``][numerary._protocol.worker_initializer].
+    """
+    snapshot, _ = _snapshot(overrides=True)
+
+    return snapshot
+
+
+def restore_state(snapshot: Mapping[str, Any]) -> int:
+    r"""
+    Restores *snapshot* (as returned by
+    [``snapshot_state``][numerary._protocol.snapshot_state]) and returns the number
+    of verdicts restored (including overrides).
+
+    ``` python
+    >>> from numerary.types import RealLike, cached_verdicts, restore_state, snapshot_state
+    >>> RealLike.excludes(float)
+    >>> snapshot = snapshot_state()
+    >>> RealLike.reset_for(float)
+    >>> _ = restore_state(snapshot)
+    >>> cached_verdicts(float)[RealLike]
+    False
+    >>> RealLike.reset_for(float)
+
+    ```
+
+    Overrides are applied as if by
+    [``register_overrides``][numerary._protocol.register_overrides], replacing any
+    verdicts already known. Other verdicts are restored as with
+    [``load_cached_verdicts``][numerary._protocol.load_cached_verdicts], including
+    being skipped under the same circumstances.
+    """
+    return _restore(snapshot)
+
+
+def worker_initializer() -> Dict[str, Any]:
+    r"""
+    Returns keyword arguments that arrange for worker processes to start with a
+    snapshot of the current state of all caching protocols (see
+    [``snapshot_state``][numerary._protocol.snapshot_state]). These are accepted by
+    both [``concurrent.futures.ProcessPoolExecutor``](https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor)
+    and [``multiprocessing.Pool``](https://docs.python.org/3/library/multiprocessing.html#multiprocessing.pool.Pool).
+    The snapshot is taken when this is called, so it should be called after
+    registering any overrides and warming caches (e.g., via
+    [``warm``][numerary._protocol.warm]).
+
+    ``` python
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from numerary.types import worker_initializer
+    >>> with ProcessPoolExecutor(max_workers=2, **worker_initializer()) as executor:
+    ...   pass
+
+    ```
+
+    See ``docs/perf_workers.ipy`` for a comparison of cold and seeded workers.
+    """
+    return {"initializer": restore_state, "initargs": (snapshot_state(),)}
+
+
+def attach_shared_verdicts(name: Optional[str] = None, slots: int = 1 << 16) -> str:
+    r"""
+    Shares verdicts computed by caching protocols with other processes via a
+    [``multiprocessing.shared_memory``](https://docs.python.org/3/library/multiprocessing.shared_memory.html)
+    segment, and returns its name. If *name* is ``#!python None``, a new segment with
+    room for *slots* verdicts is created. Otherwise, the segment named *name* is used
+    (or created if it does not exist yet). Any segment already in use by this process
+    is detached first.
+
+    Once attached, a verdict computed by any process is available to all others,
+    which then neither repeat the structural check nor build the structures supporting
+    it. Pre-fork servers can attach once before forking, since workers inherit the
+    segment. Workers started any other way (e.g., via ``spawn``) can attach by name
+    (e.g., in a pool’s initializer). Any number of processes may attach to the same
+    *name* concurrently. Those that find a segment still being set up by another wait
+    (for up to a few seconds) for it to be ready, and raise ``#!python ValueError`` if
+    it never is.
+
+    ``` python
+    >>> from numerary import RealLike
+    >>> from numerary.types import attach_shared_verdicts, detach_shared_verdicts
+    >>> name = attach_shared_verdicts()
+    >>> isinstance(1.5, RealLike)  # shared with other processes attached to name
+    True
+    >>> detach_shared_verdicts(unlink=True)
+
+    ```
+
+    Protocols and types are identified by name (along with a hash of each protocol’s
+    members and the ``numerary`` version), as with
+    [``save_cached_verdicts``][numerary._protocol.save_cached_verdicts], so those that
+    cannot be found by name (e.g., those defined inside functions) are not shared. All
+    processes are assumed to run the same code. Overrides are specific to each process,
+    so they are not shared, and neither are verdicts that may depend on them.
+    [``reset_for``][numerary._protocol.CachingProtocolMeta.reset_for] forgets shared
+    verdicts for that type as well. Verdicts that do not fit are simply not shared.
+    Cache hits are unaffected. Each process still caches the verdicts it uses, but
+    otherwise this only adds a lookup in the segment to each miss.
+    """
+    global _shared_verdicts
+
+    from multiprocessing import shared_memory
+
+    if slots < 1:
+        raise ValueError(f"slots must be positive (not {slots})")
+
+    table: Optional[_SharedVerdictTable] = None
+
+    while table is None:
+        if name is not None:
+            table = _attach_shared_table(shared_memory, name)
+
+            if table is not None:
+                break
+
+        try:
+            shm = shared_memory.SharedMemory(
+                name=name, create=True, size=8 * (2 + slots)
+            )
+        except FileExistsError:
+            # Another process created it in the interim
+            continue
+
+        table = _SharedVerdictTable(shm, slots)
+
+    with _lock:
+        previous = _shared_verdicts
+        _shared_verdicts = table
+
+        if previous is not None:
+            previous.close()
+
+    return table.shm.name
+
+
+def detach_shared_verdicts(unlink: bool = False) -> None:
+    r"""
+    Stops sharing verdicts via the segment attached by
+    [``attach_shared_verdicts``][numerary._protocol.attach_shared_verdicts], if any.
+    Verdicts already taken from it are retained. If *unlink* is ``#!python True``, the
+    segment is also destroyed once all other processes have detached from it. This
+    should be done by exactly one process (e.g., the one that created it).
+    """
+    global _shared_verdicts
+
+    with _lock:
+        table = _shared_verdicts
+        _shared_verdicts = None
+
+        if table is not None:
+            table.close()
+
+            if unlink:
+                _unlink_shared_memory(table.shm, attached=table.attached)
+
+
+def protocoldispatch(func: Callable[..., _T]) -> _ProtocolDispatchCallable[_T]:
+    r"""
+    Like [``functools.singledispatch``](https://docs.python.org/3/library/functools.html#functools.singledispatch),
+    but also accepts caching protocols as registration keys. This replaces chains of
+    ``#!python isinstance`` checks against protocols.
+
+    ``` python
+    >>> from fractions import Fraction
+    >>> from numerary.types import IntegralLike, RationalLike, RealLike, protocoldispatch
+
+    >>> @protocoldispatch
+    ... def describe(arg) -> str:
+    ...   return "something else"
+
+    >>> @describe.register(IntegralLike)
+    ... def _(arg) -> str:
+    ...   return "integral-like"
+
+    >>> @describe.register(RationalLike)
+    ... def _(arg) -> str:
+    ...   return "rational-like"
+
+    >>> @describe.register(RealLike)
+    ... def _(arg) -> str:
+    ...   return "real-like"
+
+    >>> @describe.register(bool)
+    ... def _(arg) -> str:
+    ...   return "bool"
+
+    >>> [describe(arg) for arg in (True, 1, Fraction(1, 2), 1.5, "1.5")]
+    ['bool', 'integral-like', 'rational-like', 'real-like', 'something else']
+
+    ```
+
+    Implementations are resolved from the type of the first positional argument. Those
+    registered for classes (including ABCs) are resolved as with
+    ``#!python functools.singledispatch`` and take precedence over those registered for
+    protocols. Among the protocols an argument satisfies, one is more specific than
+    another if it requires everything the other does and more, or if it derives from
+    the other. The implementation for the protocol more specific than all others
+    satisfied is used. Ties among those that are incomparable are broken in favor of
+    any whose member names include all of the others’ (and more), and then in favor of
+    whichever was registered first. So above, ``IntegralLike`` takes precedence over
+    ``RationalLike`` for ``#!python int``, since neither requires everything the other
+    does, but ``IntegralLike`` was registered first. The ``#!python object``
+    implementation (i.e., the decorated function) is used if nothing else applies.
+
+    Resolutions are cached per type. The cache is cleared whenever an implementation is
+    registered, or when any caching protocol’s verdicts are overridden via
+    [``includes``][numerary._protocol.CachingProtocolMeta.includes],
+    [``excludes``][numerary._protocol.CachingProtocolMeta.excludes], or
+    [``reset_for``][numerary._protocol.CachingProtocolMeta.reset_for].
+
+    As with caching protocols themselves, resolutions assume that all instances of a
+    type are alike. Unlike ``#!python functools.singledispatch``, the ``dispatch``
+    method takes an instance rather than a class, since protocol checks may depend on
+    instance attributes.
+    """
+    nominal = singledispatch(func)
+    protocols: Dict[CachingProtocolMeta, Tuple[FrozenSet[str], Callable]] = {}
+    registry: Dict[Any, Callable] = {object: func}
+    dispatch_cache = _DispatchCache()
+    cache_token = None
+
+    with _lock:
+        _dispatch_caches.add(dispatch_cache)
+
+    def dispatch(obj: Any) -> Callable:
+        nonlocal cache_token
+
+        if cache_token is not None:
+            current_token = get_cache_token()
+
+            # An ABC's registry changed, which may affect nominal resolutions
+            if cache_token != current_token:
+                dispatch_cache.clear()
+                cache_token = current_token
+
+        inst_t = type(obj)
+
+        # Resolutions in light of overlays are neither cached nor taken from the cache
+        overlaid = _overlaid and _overlay.get() is not None
+
+        if not overlaid:
+            try:
+                return dispatch_cache[inst_t]
+            except KeyError:
+                pass
+
+        generation = _generation
+        impl = nominal.dispatch(inst_t)
+
+        if impl is func:
+            satisfied = [
+                protocol for protocol in list(protocols) if isinstance(obj, protocol)
+            ]
+            candidates = [
+                protocol
+                for protocol in satisfied
+                if not any(_more_specific(other, protocol) for other in satisfied)
+            ]
+
+            if len(candidates) > 1:
+                # None requires everything the others do, so prefer any whose member
+                # names include all of another's, and then whichever was registered
+                # first (candidates are in registration order)
+                candidates = [
+                    protocol
+                    for protocol in candidates
+                    if not any(
+                        protocols[protocol][0] < protocols[other][0]
+                        for other in candidates
+                    )
+                ]
+
+            if candidates:
+                impl = protocols[candidates[0]][1]
+
+        with _lock:
+            # Don't cache resolutions that may have raced with an override
+            if generation == _generation and not overlaid:
+                dispatch_cache[inst_t] = impl
+
+        return impl
+
+    def register(key: Any, impl: Optional[Callable] = None) -> Any:
+        nonlocal cache_token
+
+        if impl is None:
+            if isinstance(key, type):
+                return lambda impl: register(key, impl)
+
+            impl = key
+            key = _annotated_dispatch_key(impl)
+
+        if isinstance(key, CachingProtocolMeta):
+            protocols[key] = (_protocol_member_names(key), impl)
+        else:
+            nominal.register(key, impl)
+
+            if cache_token is None and hasattr(key, "__abstractmethods__"):
+                cache_token = get_cache_token()
+
+        registry[key] = impl
+        dispatch_cache.clear()
+
+        return impl
+
+    funcname = getattr(func, "__name__", "protocoldispatch function")
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not args:
+            raise TypeError(f"{funcname} requires at least 1 positional argument")
+
+        if cache_token is None and not _overlaid:
+            try:
+                impl = dispatch_cache[type(args[0])]
+            except KeyError:
+                impl = dispatch(args[0])
+        else:
+            impl = dispatch(args[0])
+
+        return impl(*args, **kwargs)
+
+    setattr(wrapper, "dispatch", dispatch)
+    setattr(wrapper, "register", register)
+    setattr(wrapper, "registry", MappingProxyType(registry))
+    setattr(wrapper, "_clear_cache", dispatch_cache.clear)
+    update_wrapper(wrapper, func)
+
+    return wrapper  # type: ignore [return-value]
+
+
+def _check_plan(protocol: Type) -> _CheckPlan:
+    bases: Dict[Type, None] = {}
+    typing_bases: Dict[Type, _MembersT] = {}
+    members: List[Tuple[str, bool]] = []
+
+    def _fold(cls: Type) -> None:
+        # This mirrors beartype.typing.Protocol.__instancecheck__'s miss path (i.e.,
+        # objects must be instances of each base and have each member)
+        for base in cls.__bases__:
+            if base is cls or base.__name__ in _IGNORABLE_BASE_NAMES:
+                continue
+
+            if isinstance(base, CachingProtocolMeta):
+                bases[base] = None
+            elif isinstance(base, _BeartypeCachingProtocolMeta):
+                _fold(base)
+            elif (
+                type(base) is type(typing.Protocol)
+                and getattr(base, "_is_protocol", False)
+                and getattr(base, "_is_runtime_protocol", False)
+            ):
+                typing_bases[base] = _typing_protocol_members(base)
+            else:
+                bases[base] = None
+
+        members.extend(
+            (attr_name, callable(getattr(cls, attr_name, None)))
+            for attr_name in _member_names(cls)
+        )
+
+    _fold(protocol)
+
+    return _CheckPlan(tuple(bases), tuple(typing_bases.items()), _members(members))
+
+
+def _plan_requirements(plan: _CheckPlan) -> FrozenSet[Any]:
+    # Returns everything plan checks for, such that any plan whose requirements are a
+    # subset would be satisfied by whatever satisfies this one
+    attr_names, blockable_names = plan.members
+
+    return frozenset(
+        chain(
+            plan.bases,
+            (base for base, _ in plan.typing_bases),
+            (("present", attr_name) for attr_name in attr_names),
+            (("unblocked", attr_name) for attr_name in blockable_names),
+        )
+    )
+
+
+def _plan_admits(plan: _CheckPlan, obj: Any) -> bool:
+    for base in plan.bases:
+        if not isinstance(obj, base):
+            return False
+
+    # Members come before typing bases because those can be expensive to rule out
+    if not _has_members(obj, plan.members):
+        return False
+
+    for base, typing_members in plan.typing_bases:
+        # typing's check is satisfied by these alone, and only needs to consult
+        # anything else (e.g., registered virtual subclasses) when they're absent
+        if not (
+            _has_members(obj, typing_members, static=_TYPING_STATIC_LOOKUPS)
+            or isinstance(obj, base)
+        ):
+            return False
+
+    return True
+
+
+def _members(members: Iterable[Tuple[str, bool]]) -> _MembersT:
+    # Returns all names of members along with those of members that can be "blocked"
+    attr_names: Dict[str, None] = {}
+    blockable_names: Set[str] = set()
+
+    for attr_name, blockable in members:
+        attr_names[attr_name] = None
+
+        if blockable:
+            blockable_names.add(attr_name)
+
+    return frozenset(attr_names), frozenset(blockable_names)
+
+
+def _has_members(obj: Any, members: _MembersT, static: bool = False) -> bool:
+    attr_names, blockable_names = members
+    index = _static_member_index if static else _member_index
+    entry = index.get(type(obj))
+
+    if entry is None or not attr_names <= entry[0]:
+        entry = _probe_members(obj, index, attr_names, static)
+
+    _, absent, blocked = entry
+
+    return absent.isdisjoint(attr_names) and blocked.isdisjoint(blockable_names)
+
+
+def _probe_members(
+    obj: Any,
+    index: Dict[Type, _MemberIndexEntryT],
+    attr_names: FrozenSet[str],
+    static: bool,
+) -> _MemberIndexEntryT:
+    # Probes obj for any of attr_names not yet in the index for its type
+    inst_t = type(obj)
+    unprobed = list(attr_names - index.get(inst_t, _EMPTY_MEMBER_INDEX_ENTRY)[0])
+
+    lookup: Callable[[Any, str, Any], Any]
+
+    if static:
+        from inspect import getattr_static as lookup
+    else:
+        lookup = getattr
+
+    values = [lookup(obj, attr_name, _MISSING) for attr_name in unprobed]
+    absent = [
+        attr_name for attr_name, value in zip(unprobed, values) if value is _MISSING
+    ]
+    blocked = [attr_name for attr_name, value in zip(unprobed, values) if value is None]
+
+    with _lock:
+        # Another thread may have probed names this one hasn't
+        probed, other_absent, other_blocked = index.get(
+            inst_t, _EMPTY_MEMBER_INDEX_ENTRY
+        )
+        entry = index[inst_t] = (
+            probed.union(unprobed),
+            other_absent.union(absent) if absent else other_absent,
+            other_blocked.union(blocked) if blocked else other_blocked,
+        )
+
+    return entry
+
+
+def _typing_protocol_members(protocol: Type) -> _MembersT:
+    if sys.version_info >= (3, 12):
+        protocol_attrs = protocol.__protocol_attrs__  # type: ignore [attr-defined]
+    else:
+        protocol_attrs = typing._get_protocol_attrs(protocol)  # type: ignore [attr-defined]
+
+    return _members(
+        (attr_name, callable(getattr(protocol, attr_name, None)))
+        for attr_name in sorted(protocol_attrs)
+    )
+
+
+def _assign_index(protocol: CachingProtocolMeta) -> int:
+    # Returns an index for protocol, reusing that of a collected protocol if there is
+    # one (after forgetting everything recorded for it). Must be called while holding
+    # _lock.
+    global _protocols_epoch
+
+    _protocols_epoch += 1
+
+    for index, protocol_ref in enumerate(_protocols_by_index):
+        if protocol_ref() is None:
+            break
+    else:
+        _protocols_by_index.append(ref(protocol))
+
+        return len(_protocols_by_index) - 1
+
+    mask = (_KNOWN | _SUPPORTED) << (2 * index)
+
+    for inst_t, bits in list(_verdicts.items()):
+        if bits & mask:
+            if bits & ~mask:
+                _verdicts[inst_t] = bits & ~mask
+            else:
+                del _verdicts[inst_t]
+
+    if _verdicts_stash:
+        for inst_t_id, (inst_t_ref, bits, pinned) in list(_verdicts_stash.items()):
+            if bits & mask:
+                _verdicts_stash[inst_t_id] = (inst_t_ref, bits & ~mask, pinned)
+
+    for _, keys in _shared_keys.values():
+        keys.pop(index, None)
+
+    _protocols_by_index[index] = ref(protocol)
+
+    return index
+
+
+def _verdict_bits(inst_t: Type) -> int:
+    # Returns the bitmask of verdicts for inst_t, even if it has been parked for the
+    # current garbage collection. Must be called while holding _lock.
+    bits = _verdicts.get(inst_t)
+
+    if bits is not None:
+        return bits
+
+    if _verdicts_stash:
+        stashed = _verdicts_stash.get(id(inst_t))
+
+        if stashed is not None and stashed[0]() is inst_t:
+            return stashed[1]
+
+    return 0
+
+
+def _override_changes(
+    types: Union[Type, Iterable[Type]],
+    include: Iterable[CachingProtocolMeta] = (),
+    exclude: Iterable[CachingProtocolMeta] = (),
+) -> List[_OverrideT]:
+    # Returns the changes register_overrides makes
+    inst_ts = (types,) if isinstance(types, type) else tuple(types)
+    include = tuple(include)
+    exclude = tuple(exclude)
+    both = set(include).intersection(exclude)
+
+    if both:
+        raise ValueError(
+            f"cannot both include and exclude {', '.join(protocol.__name__ for protocol in both)}"
+        )
+
+    return [(protocol, inst_t, True) for inst_t in inst_ts for protocol in include] + [
+        (protocol, inst_t, False) for inst_t in inst_ts for protocol in exclude
+    ]
+
+
+def _change_overrides(changes: Iterable[_OverrideT], batched: bool = True) -> None:
+    # Changes are deferred while the current thread is in a batch_overrides block,
+    # unless batched is False (e.g., for registrations that must not be discarded
+    # along with the block's if it raises)
+    changes_in_batch = getattr(_batching, "changes", None) if batched else None
+
+    if changes_in_batch is not None:
+        changes_in_batch.extend(changes)
+    else:
+        with _lock:
+            _apply_overrides(changes)
+
+
+def _apply_overrides(changes: Iterable[_OverrideT]) -> None:
+    # Applies overrides (where None means resetting), and then invalidates verdicts of
+    # protocols deriving from those changed. Must be called while holding _lock.
+    global _generation
+
+    changed: Dict[Type, Dict[CachingProtocolMeta, None]] = {}
+
+    for protocol, inst_t, verdict in changes:
+        protocol._abc_inst_check_generation += 1
+        protocol._unstash_for(inst_t)
+
+        if verdict is None:
+            # The type may have changed since its members were probed
+            _member_index.pop(inst_t, None)
+            _static_member_index.pop(inst_t, None)
+
+            if _shared_verdicts is not None:
+                _shared_verdicts.put(protocol, inst_t, None)
+
+            if (
+                inst_t not in protocol._abc_inst_check_cache
+                and protocol._known_verdict(inst_t) is None
+            ):
+                continue
+
+            protocol._abc_inst_check_cache.pop(inst_t, None)
+            protocol._abc_inst_check_cache_overridden.pop(inst_t, None)
+        else:
+            protocol._abc_inst_check_cache_overridden[inst_t] = True
+            protocol._abc_inst_check_cache[inst_t] = verdict
+
+        protocol._record_verdict(inst_t, verdict)
+        changed.setdefault(inst_t, {})[protocol] = None
+
+    _generation += 1
+
+    for inst_t, protocols in changed.items():
+        _dirty_for(inst_t, protocols)
+
+    if changed:
+        _clear_dispatch_caches()
+
+
+def _dirty_for(inst_t: Type, protocols: Iterable[CachingProtocolMeta]) -> None:
+    # Invalidates verdicts for inst_t of protocols deriving from protocols, directly or
+    # not. Those with overridden verdicts no longer depend on their bases (and neither
+    # do protocols deriving from them by way of them), so the walk stops there. Only
+    # affected protocols are visited. Must be called while holding _lock.
+    pending = [
+        listener
+        for protocol in protocols
+        for listener in protocol._abc_inst_check_cache_listeners
+    ]
+    seen = set(pending)
+
+    while pending:
+        inheriting_cls = pending.pop()
+
+        if inst_t in inheriting_cls._abc_inst_check_cache_overridden:
+            continue
+
+        inheriting_cls._abc_inst_check_generation += 1
+
+        if _stats_enabled and (
+            inst_t in inheriting_cls._abc_inst_check_cache
+            or inheriting_cls._known_verdict(inst_t) is not None
+        ):
+            inheriting_cls._abc_inst_check_stats[_INVALIDATIONS] += 1
+
+        inheriting_cls._abc_inst_check_cache.pop(inst_t, None)
+        inheriting_cls._record_verdict(inst_t, None)
+
+        if _shared_verdicts is not None:
+            # Whoever needs it next will check again
+            _shared_verdicts.put(inheriting_cls, inst_t, None)
+
+        if inheriting_cls._abc_inst_check_cache_stash:
+            stashed = inheriting_cls._abc_inst_check_cache_stash.get(id(inst_t))
+
+            if stashed is not None and not stashed[2]:
+                inheriting_cls._unstash_for(inst_t)
+
+        for listener in inheriting_cls._abc_inst_check_cache_listeners:
+            if listener not in seen:
+                seen.add(listener)
+                pending.append(listener)
+
+
+def _snapshot(overrides: bool) -> Tuple[Dict[str, Any], int]:
+    # Returns a snapshot of verdicts (and, if overrides is True, overrides and cache
+    # settings) suitable for _restore, along with the number of verdicts in it
+    protocols: Dict[str, Dict[str, Any]] = {}
+    num_verdicts = 0
+
+    def _saved_protocol(protocol: CachingProtocolMeta) -> Optional[Dict[str, Any]]:
+        protocol_name = _qualified_name(protocol)
+
+        if protocol_name is None:
+            return None
+
+        if protocol_name not in protocols:
+            protocols[protocol_name] = {
+                "members": _members_hash(protocol),
+                "verdicts": {},
+            }
+
+            if overrides:
+                protocols[protocol_name].update(
+                    {
+                        "overrides": {},
+                        "maxsize": protocol._abc_inst_check_cache_maxsize,
+                        "weakkeys": protocol._abc_inst_check_cache_weakkeys,
+                    }
+                )
+
+        return protocols[protocol_name]
+
+    with _lock:
+        all_bits = list(_verdicts.items())
+
+        if _verdicts_stash:
+            # We're in the middle of a full garbage collection
+            for inst_t_ref, bits, _ in _verdicts_stash.values():
+                inst_t = inst_t_ref()
+
+                if inst_t is not None:
+                    all_bits.append((inst_t, bits))
+
+        for inst_t, bits in all_bits:
+            inst_t_name = _qualified_name(inst_t)
+
+            if inst_t_name is None:
+                continue
+
+            index = 0
+
+            while bits:
+                protocol = _protocols_by_index[index]() if bits & _KNOWN else None
+
+                if protocol is not None:
+                    # Overrides are saved only if asked, and verdicts computed in
+                    # light of them (e.g., with an overridden base) never are, since
+                    # they may not hold wherever they're loaded
+                    if protocol._abc_inst_check_cache_overridden.get(inst_t):
+                        key = "overrides" if overrides else ""
+                    else:
+                        key = (
+                            "" if protocol._depends_on_override(inst_t) else "verdicts"
+                        )
+
+                    saved_protocol = _saved_protocol(protocol) if key else None
+
+                    if saved_protocol is not None:
+                        saved_protocol[key][inst_t_name] = bool(bits & _SUPPORTED)
+                        num_verdicts += 1
+
+                bits >>= 2
+                index += 1
+
+        if overrides:
+            # Include cache settings even for protocols with no verdicts
+            for protocol in list(_caching_protocols):
+                _saved_protocol(protocol)
+
+        snapshot: Dict[str, Any] = {
+            "numerary": _numerary_version(),
+            "protocols": protocols,
+        }
+
+        if overrides:
+            snapshot["default_maxsize"] = _default_cache_maxsize
+
+    return snapshot, num_verdicts
+
+
+def _restore(saved: Any) -> int:
+    global _default_cache_maxsize
+
+    if not isinstance(saved, Mapping) or saved.get("numerary") != _numerary_version():
+        return 0
+
+    num_restored = 0
+    found: List[Tuple[CachingProtocolMeta, Mapping[str, Any]]] = []
+    changes: List[_OverrideT] = []
+
+    with _lock:
+        if "default_maxsize" in saved:
+            _default_cache_maxsize = saved["default_maxsize"]
+
+        for protocol_name, saved_protocol in saved.get("protocols", {}).items():
+            protocol = _find_qualified_name(protocol_name)
+
+            if not isinstance(protocol, CachingProtocolMeta) or saved_protocol.get(
+                "members"
+            ) != _members_hash(protocol):
+                continue
+
+            found.append((protocol, saved_protocol))
+
+            if "maxsize" in saved_protocol:
+                maxsize = saved_protocol["maxsize"]
+
+                if maxsize != protocol._abc_inst_check_cache_maxsize:
+                    protocol._set_cache_maxsize(maxsize)
+
+            if "weakkeys" in saved_protocol:
+                protocol._abc_inst_check_cache_weakkeys = bool(
+                    saved_protocol["weakkeys"]
+                )
+
+            for inst_t_name, verdict in saved_protocol.get("overrides", {}).items():
+                inst_t = _find_qualified_name(inst_t_name)
+
+                if isinstance(inst_t, type):
+                    changes.append((protocol, inst_t, bool(verdict)))
+
+        # Overrides come first, since the verdicts of protocols deriving from those
+        # overridden were computed in light of them
+        if changes:
+            _apply_overrides(changes)
+            num_restored += len(changes)
+
+        for protocol, saved_protocol in found:
+            for inst_t_name, verdict in saved_protocol.get("verdicts", {}).items():
+                inst_t = _find_qualified_name(inst_t_name)
+
+                # Verdicts saved elsewhere may not hold in light of our overrides
+                if (
+                    isinstance(inst_t, type)
+                    and protocol._known_verdict(inst_t) is None
+                    and inst_t not in protocol._abc_inst_check_cache
+                    and not protocol._depends_on_override(inst_t)
+                ):
+                    protocol._abc_inst_check_cache[inst_t] = bool(verdict)
+                    protocol._record_verdict(inst_t, bool(verdict))
+                    num_restored += 1
+
+    return num_restored
+
+
+def _shared_key(
+    protocol: CachingProtocolMeta, inst_t: Type, shielded: bool
+) -> Optional[int]:
+    # Returns the key identifying the verdict for inst_t of protocol in every process,
+    # or None if there isn't one. Must be called while holding _lock.
+    prefix = protocol._abc_inst_check_shared_ident
+
+    if prefix is None:
+        protocol_name = _qualified_name(protocol)
+        prefix = protocol._abc_inst_check_shared_ident = (
+            ""  # unnameable
+            if protocol_name is None
+            else f"{_numerary_version()}:{protocol_name}({_members_hash(protocol)})|"
+        )
+
+    if not prefix:
+        return None
+
+    if shielded and protocol._depends_on_override(inst_t):
+        # Verdicts that may depend on overrides are neither shared nor taken from
+        # other processes
+        return None
+
+    try:
+        inst_t_name, keys = _shared_keys[inst_t]
+    except KeyError:
+        inst_t_name, keys = _shared_keys[inst_t] = (_qualified_name(inst_t), {})
+
+    if inst_t_name is None:
+        return None
+
+    index = protocol._abc_inst_check_index
+
+    try:
+        return keys[index]
+    except KeyError:
+        digest = blake2b((prefix + inst_t_name).encode(), digest_size=8)
+        key = keys[index] = (
+            int.from_bytes(digest.digest(), "little") & ~0b11 or 0b100
+        )
+
+        return key
+
+
+def _attach_shared_table(
+    shared_memory: ModuleType, name: str
+) -> Optional[_SharedVerdictTable]:
+    # Returns the table in the segment named name, or None if there is no such
+    # segment. Whoever is creating it may not have sized it or written its header yet,
+    # so this waits (up to _SHARED_ATTACH_TIMEOUT) for both.
+    deadline = time.monotonic() + _SHARED_ATTACH_TIMEOUT
+
+    while True:
+        try:
+            return _SharedVerdictTable(_attach_shared_memory(shared_memory, name))
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # It's either still empty (and can't be mapped) or lacks a header
+            if time.monotonic() >= deadline:
+                raise
+
+        time.sleep(0.001)
+
+
+def _attach_shared_memory(shared_memory: ModuleType, name: str) -> Any:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+
+    if os.name == "posix":
+        # Otherwise, this process's resource tracker destroys the segment when it
+        # exits, even though it didn't create it (see
+        # <https://github.com/python/cpython/issues/82300>)
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(getattr(shm, "_name", shm.name), "shared_memory")
+
+    return shm
+
+
+def _unlink_shared_memory(shm: Any, attached: bool) -> None:
+    if attached and sys.version_info < (3, 13) and os.name == "posix":
+        # Undo _attach_shared_memory's unregistering, since unlinking unregisters
+        from multiprocessing import resource_tracker
+
+        resource_tracker.register(getattr(shm, "_name", shm.name), "shared_memory")
+
+    shm.unlink()
+
+
+def _install_instancecheck() -> None:
+    # Must be called while holding _lock
+    global _overlaid
+
+    _overlaid = bool(_live_overlays)
+
+    if _overlaid:
+        instancecheck = CachingProtocolMeta._inst_check_overlaid
+    elif _stats_enabled:
+        instancecheck = CachingProtocolMeta._inst_check_counted
+    else:
+        instancecheck = CachingProtocolMeta._inst_check_uncounted
+
+    setattr(CachingProtocolMeta, "__instancecheck__", instancecheck)
+
+
+def _release_overlays(blocking: bool = True) -> None:
+    # Overlays can be finalized anywhere, including while this thread holds the lock
+    # (e.g., during a garbage collection), so finalizers don't wait for it. The next
+    # overlaid instance check (or whoever releases the next overlay) tries again.
+    global _release_pending
+
+    if not _overlaid:
+        return
+
+    if not _lock.acquire(blocking=blocking):
+        _release_pending = True
+
+        return
+
+    try:
+        _release_pending = False
+        _live_overlays[:] = [
+            overlay_ref for overlay_ref in _live_overlays if overlay_ref() is not None
+        ]
+
+        if not _live_overlays:
+            _install_instancecheck()
+    finally:
+        _lock.release()
+
+
+def _annotated_dispatch_key(impl: Callable) -> Any:
+    # This mirrors functools.singledispatch's handling of @register without a class
+    from typing import get_type_hints
+
+    if not getattr(impl, "__annotations__", None):
+        raise TypeError(
+            f"Invalid first argument to `register()`: {impl!r}. Use either `@register(some_class)` or plain `@register` on an annotated function."
+        )
+
+    arg_name, key = next(iter(get_type_hints(impl).items()))
+
+    if not isinstance(key, type):
+        raise TypeError(f"Invalid annotation for {arg_name!r}. {key!r} is not a class.")
+
+    return key
+
+
+def _more_specific(protocol: CachingProtocolMeta, other: CachingProtocolMeta) -> bool:
+    # Whether protocol is more specific than other for protocoldispatch, i.e., whether
+    # it requires everything other does and more, or derives from other. Either implies
+    # that it requires at least as much, so this is never true both ways.
+    return protocol is not other and (
+        other in protocol.__mro__
+        or other._abc_inst_check_requirements < protocol._abc_inst_check_requirements
+    )
+
+
+def _clear_dispatch_caches() -> None:
+    # Callers must hold _lock
+    for dispatch_cache in list(_dispatch_caches):
+        dispatch_cache.clear()
+
+
+def _stash_heap_types(
+    cache: Dict[Type, Any], overridden: Dict[Type, bool]
+) -> Dict[int, Tuple[ref, Any, bool]]:
+    stash: Dict[int, Tuple[ref, Any, bool]] = {}
+
+    for inst_t, verdict in list(cache.items()):
+        if inst_t.__flags__ & _Py_TPFLAGS_HEAPTYPE:
+            stash[id(inst_t)] = (ref(inst_t), verdict, overridden.get(inst_t, False))
+            del cache[inst_t]
+            overridden.pop(inst_t, None)
+
+    return stash
+
+
+def _unstash_heap_types(
+    cache: Dict[Type, Any],
+    overridden: Dict[Type, bool],
+    stash: Dict[int, Tuple[ref, Any, bool]],
+) -> None:
+    for inst_t_ref, verdict, pinned in stash.values():
+        inst_t = inst_t_ref()
+
+        # Entries set while stashed are more recent than those in the stash
+        if inst_t is not None and inst_t not in cache:
+            if pinned:
+                overridden[inst_t] = True
+
+            cache[inst_t] = verdict
+
+
+def _sample(t: Any) -> Any:
+    if not isinstance(t, type):
+        return t
+
+    try:
+        sample = t(0)
+    except Exception:
+        try:
+            sample = t()
+        except Exception:
+            sample = None
+
+    if type(sample) is not t:
+        raise TypeError(f"unable to create an instance of {t!r} (provide one instead)")
+
+    return sample
+
+
+def _weakly_keyed(cache: _CacheT) -> _CacheT:
+    r"""
+    Registers *cache* (a dictionary keyed by type) to have its heap type keys stashed
+    during full garbage collections just like caching protocols’ caches, so that it
+    does not keep otherwise unreferenced classes alive. Entries whose keys are
+    collected are discarded. Lookups remain ordinary dictionary lookups.
+    """
+    _type_keyed_caches.append(cache)
+
+    return cache
+
+
+def _numpy() -> Optional[ModuleType]:
+    # We never import numpy ourselves. If it hasn't been imported, there can't be any
+    # arrays or dtypes.
+    return sys.modules.get("numpy")
+
+
+def _numpy_zero(dtype: Any) -> Any:
+    numpy = sys.modules["numpy"]
+
+    # This works for all dtypes, including those whose scalar types can't be created
+    # from 0 (e.g., structured ones)
+    return numpy.zeros((), dtype=dtype)[()]
+
+
+def _numerary_version() -> str:
+    from . import __vers_str__
+
+    return __vers_str__
+
+
+def _qualified_name(obj: Type) -> Optional[str]:
+    name = f"{obj.__module__}:{obj.__qualname__}"
+
+    # Only names that can be found again are useful (e.g., not those of classes
+    # defined inside functions or created dynamically)
+    return name if _find_qualified_name(name) is obj else None
+
+
+def _find_qualified_name(name: str) -> Any:
+    module_name, _, qualname = name.partition(":")
+    obj = sys.modules.get(module_name)
+
+    for attr_name in qualname.split("."):
+        obj = getattr(obj, attr_name, None)
+
+    # Guard against names that now refer to something else (e.g., via aliasing)
+    if obj is None or getattr(obj, "__qualname__", None) != qualname:
+        return None
+
+    return obj
+
+
+def _member_names(base: Type) -> List[str]:
+    return [
+        attr_name
+        for attr_name in chain(base.__dict__, base.__dict__.get("__annotations__", {}))
+        if not attr_name.startswith("_abc_")
+        and attr_name not in _PROTOCOL_ATTR_NAMES_IGNORABLE
+    ]
+
+
+def _members_hash(protocol: CachingProtocolMeta) -> str:
+    members = sha256()
+
+    for base in protocol.__mro__:
+        if base.__name__ in _IGNORABLE_BASE_NAMES:
+            continue
+
+        member_names = sorted(_member_names(base))
+        members.update(f"{base.__qualname__}({','.join(member_names)});".encode())
+
+    return members.hexdigest()
+
+
+def _protocol_member_names(protocol: CachingProtocolMeta) -> FrozenSet[str]:
+    return frozenset(
+        chain.from_iterable(
+            _member_names(base)
+            for base in protocol.__mro__
+            if base.__name__ not in _IGNORABLE_BASE_NAMES
+        )
+    )
+
+
+def _stash_all() -> None:
+    global _verdicts_stash
+
+    _verdicts_stash = _stash_heap_types(_verdicts, {})
+
+    for protocol in list(_caching_protocols):
+        protocol._stash_weakkeys()
+
+    # Plain beartype caching protocols (e.g., beartype.typing.SupportsAbs) from
+    # which ours derive hold references, too
+    for beartype_protocol in list(_beartype_protocols):
+        _beartype_stashes[beartype_protocol] = _stash_heap_types(
+            beartype_protocol._abc_inst_check_cache, {}
+        )
+
+    for cache in chain(_type_keyed_caches, list(_dispatch_caches)):
+        _type_keyed_stashes.append((cache, _stash_heap_types(cache, {})))
+
+
+def _unstash_all() -> None:
+    global _verdicts_stash
+
+    verdicts_stash = _verdicts_stash
+    _verdicts_stash = None
+
+    if verdicts_stash:
+        _unstash_heap_types(_verdicts, {}, verdicts_stash)
+
+    for protocol in list(_caching_protocols):
+        protocol._unstash_weakkeys()
+
+    for beartype_protocol, stash in _beartype_stashes.items():
+        _unstash_heap_types(beartype_protocol._abc_inst_check_cache, {}, stash)
+
+    _beartype_stashes.clear()
+
+    for cache, stash in _type_keyed_stashes:
+        _unstash_heap_types(cache, {}, stash)
+
+    _type_keyed_stashes.clear()
+
+
+def _on_gc(phase: str, info: Dict[str, Any]) -> None:
+    global _gc_stashed
+
+    # Only full collections are worth the trouble. Classes surviving younger
+    # collections because we reference them will eventually be promoted.
+    if info.get("generation") != 2:
+        return
+
+    if phase == "start":
+        # Collections can start anywhere, including while this thread holds the lock,
+        # so don't wait for it. Whatever isn't stashed this time around will be
+        # collected in a later one.
+        if _lock.acquire(blocking=False):
+            try:
+                _stash_all()
+                _gc_stashed = True
+            finally:
+                _lock.release()
+    elif phase == "stop" and _gc_stashed:
+        # Finalizers may have taken (and released) the lock in the interim
+        with _lock:
+            _unstash_all()
+            _gc_stashed = False
+
+
+# ---- Initialization ------------------------------------------------------------------
+
+
+# typing's structural checks use getattr_static as of Python 3.12
+_TYPING_STATIC_LOOKUPS = sys.version_info >= (3, 12)
+_weakly_keyed(_member_index)
+_weakly_keyed(_static_member_index)
+_weakly_keyed(_shared_keys)
+
+if hasattr(gc, "callbacks"):
+    gc.callbacks.append(_on_gc)
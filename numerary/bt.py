@@ -9,15 +9,25 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, TypeVar
+from contextlib import contextmanager
+from threading import Lock
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, Iterator, Tuple, TypeVar
+from weakref import WeakKeyDictionary, WeakSet
 
-__all__ = ("beartype",)
+__all__ = (
+    "beartype",
+    "beartype_checking",
+    "beartype_enabled",
+    "set_beartype_enabled",
+)
 
 
 # ---- Types ---------------------------------------------------------------------------
 
 
 _T = TypeVar("_T")
+_VariantsT = Tuple[Tuple[CodeType, Any], Tuple[CodeType, Any]]
 
 
 # ---- Functions -----------------------------------------------------------------------
@@ -27,29 +37,187 @@ def identity(__: _T) -> _T:
     return __
 
 
+def beartype(func: _T) -> _T:
+    r"""
+    Decorator that registers *func* for runtime type checking via
+    [``beartype``](https://pypi.org/project/beartype/) whenever checking is enabled
+    (see [``set_beartype_enabled``][numerary.bt.set_beartype_enabled]). *func* itself
+    is returned, so references to it remain valid no matter how often checking is
+    switched on or off. While checking is off, calling *func* costs nothing extra.
+
+    Functions with closures (e.g., methods that call ``#!python super()``) cannot be
+    switched, so they are type-checked (or not) depending only on whether checking is
+    enabled when they are decorated.
+    """
+    if not isinstance(func, FunctionType) or func.__closure__:
+        return _beartype(func) if _enabled else func
+
+    with _lock:
+        _registered.add(func)
+
+        if _enabled:
+            _set_variant(func, checked=True)
+
+    return func  # type: ignore [return-value]
+
+
+def beartype_enabled() -> bool:
+    r"""
+    Returns whether runtime type checking is currently enabled for functions decorated
+    with [``beartype``][numerary.bt.beartype] (including ``numerary``’s helper
+    functions).
+    """
+    return _enabled
+
+
+def set_beartype_enabled(enabled: bool) -> None:
+    r"""
+    Turns runtime type checking on or off for all functions decorated with
+    [``beartype``][numerary.bt.beartype] (including ``numerary``’s helper functions).
+    The initial setting is taken from the ``NUMERARY_BEARTYPE`` environment variable.
+    Type-checked variants are built the first time checking is turned on and retained
+    thereafter, so switching is cheap. This setting is process-wide (i.e., it is not
+    specific to any thread).
+
+    ``` python
+    >>> from numerary.types import __floor__, beartype_enabled, set_beartype_enabled
+    >>> was_enabled = beartype_enabled()
+    >>> set_beartype_enabled(True)
+    >>> __floor__("1.5")  # type: ignore [arg-type]
+    Traceback (most recent call last):
+      ...
+    beartype.roar.BeartypeCallHintParamViolation: Function numerary.types.__floor__() parameter operand='1.5' violates type hint ...
+    >>> set_beartype_enabled(False)
+    >>> __floor__("1.5")  # type: ignore [arg-type]
+    Traceback (most recent call last):
+      ...
+    TypeError: must be real number, not str
+    >>> set_beartype_enabled(was_enabled)
+
+    ```
+    """
+    global _enabled
+
+    enabled = bool(enabled)
+
+    with _lock:
+        if enabled == _enabled:
+            return
+
+        _enabled = enabled
+
+        for func in list(_registered):
+            _set_variant(func, checked=enabled)
+
+
+@contextmanager
+def beartype_checking(enabled: bool = True) -> Iterator[None]:
+    r"""
+    Context manager that turns runtime type checking on (or off if *enabled* is
+    ``#!python False``) for its duration, restoring the previous setting on exit. See
+    [``set_beartype_enabled``][numerary.bt.set_beartype_enabled].
+
+    ``` python
+    >>> from numerary.types import __floor__, beartype_checking
+    >>> with beartype_checking():
+    ...   __floor__("1.5")  # type: ignore [arg-type]
+    Traceback (most recent call last):
+      ...
+    beartype.roar.BeartypeCallHintParamViolation: Function numerary.types.__floor__() parameter operand='1.5' violates type hint ...
+
+    ```
+    """
+    was_enabled = _enabled
+    set_beartype_enabled(enabled)
+
+    try:
+        yield
+    finally:
+        set_beartype_enabled(was_enabled)
+
+
+def _beartype(func: Any) -> Any:
+    from beartype import beartype as _real_beartype
+
+    return _real_beartype(func)
+
+
+def _set_variant(func: FunctionType, checked: bool) -> None:
+    variants = _variants.get(func)
+
+    if variants is None:
+        if not checked:
+            return
+
+        variants = _variants[func] = _build_variants(func)
+
+    code, kwdefaults = variants[checked]
+
+    # The trampoline ignores any extra keyword defaults and the original ignores the
+    # trampoline's, so swapping them in this order means concurrent callers always see
+    # a consistent pair
+    if checked:
+        func.__kwdefaults__ = kwdefaults
+        func.__code__ = code
+    else:
+        func.__code__ = code
+        func.__kwdefaults__ = kwdefaults
+
+
+def _build_variants(func: FunctionType) -> _VariantsT:
+    from inspect import signature
+
+    # Check a copy so that the checked variant does not call back into the trampoline
+    unchecked = FunctionType(
+        func.__code__,
+        func.__globals__,
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    unchecked.__kwdefaults__ = func.__kwdefaults__
+    unchecked.__annotations__ = dict(func.__annotations__)
+    unchecked.__doc__ = func.__doc__
+    unchecked.__module__ = func.__module__
+    unchecked.__qualname__ = func.__qualname__
+    unchecked.__dict__.update(func.__dict__)
+    checked = _beartype(unchecked)
+
+    # Keep introspection honest while the trampoline's code is swapped in
+    setattr(func, "__signature__", signature(func))
+    trampoline_kwdefaults: Dict[str, Any] = dict(func.__kwdefaults__ or {})
+    trampoline_kwdefaults["_numerary_checked"] = checked
+
+    return (
+        (func.__code__, func.__kwdefaults__),
+        (_trampoline.__code__, trampoline_kwdefaults),
+    )
+
+
+def _trampoline(*args, _numerary_checked: Callable, **kwargs):
+    return _numerary_checked(*args, **kwargs)
+
+
 # ---- Initialization ------------------------------------------------------------------
 
 
 _NUMERARY_BEARTYPE = os.environ.get("NUMERARY_BEARTYPE", "no")
 _truthy = ("on", "t", "true", "yes")
 _falsy = ("off", "f", "false", "no")
-_use_beartype_internally: bool
+_enabled: bool
 
 try:
-    _use_beartype_internally = bool(int(_NUMERARY_BEARTYPE))
+    _enabled = bool(int(_NUMERARY_BEARTYPE))
 except ValueError:
     if _NUMERARY_BEARTYPE.lower() in _truthy:
-        _use_beartype_internally = True
+        _enabled = True
     elif _NUMERARY_BEARTYPE.lower() in _falsy:
-        _use_beartype_internally = False
+        _enabled = False
     else:
         raise EnvironmentError(
             f"""unrecognized value ({_NUMERARY_BEARTYPE}) for NUMERARY_BEARTYPE environment variable (should be "{'", "'.join(_truthy + _falsy)}", or an integer)"""
         )
 
-if not TYPE_CHECKING and _use_beartype_internally:
-    from beartype import beartype as _beartype
-
-    beartype = _beartype
-else:
-    beartype = identity
+_lock = Lock()
+_registered: WeakSet[FunctionType] = WeakSet()
+_variants: WeakKeyDictionary[FunctionType, _VariantsT] = WeakKeyDictionary()
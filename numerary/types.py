@@ -8,14 +8,25 @@
 
 from __future__ import annotations
 
-import logging
 import math
 import sys
-import traceback
 from abc import abstractmethod
+from array import array
 from decimal import Decimal
 from fractions import Fraction
-from typing import TYPE_CHECKING, Any, Generic, Optional
+from itertools import zip_longest
+from operator import attrgetter, index, methodcaller
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+)
 from typing import Protocol as _Protocol
 from typing import Tuple, Type, TypeVar, Union, overload, runtime_checkable
 
@@ -26,7 +37,34 @@ from beartype.typing import SupportsIndex as _SupportsIndex
 from beartype.typing import SupportsInt as _SupportsInt
 from beartype.typing import SupportsRound as _SupportsRound
 
-from ._protocol import CachingProtocolMeta
+from ._post_import import when_imported
+from ._protocol import CacheInfo  # noqa: F401
+from ._protocol import WarmInfo  # noqa: F401
+from ._protocol import attach_shared_verdicts  # noqa: F401
+from ._protocol import batch_overrides  # noqa: F401
+from ._protocol import cached_verdicts  # noqa: F401
+from ._protocol import detach_shared_verdicts  # noqa: F401
+from ._protocol import load_cached_verdicts  # noqa: F401
+from ._protocol import protocoldispatch  # noqa: F401
+from ._protocol import register_overrides  # noqa: F401
+from ._protocol import restore_state  # noqa: F401
+from ._protocol import save_cached_verdicts  # noqa: F401
+from ._protocol import set_default_cache_maxsize  # noqa: F401
+from ._protocol import set_stats_enabled  # noqa: F401
+from ._protocol import snapshot_state  # noqa: F401
+from ._protocol import stats  # noqa: F401
+from ._protocol import warm  # noqa: F401
+from ._protocol import worker_initializer  # noqa: F401
+from ._protocol import (
+    CachingProtocolMeta,
+    _change_overrides,
+    _numpy,
+    _override_changes,
+    _weakly_keyed,
+)
+from .bt import beartype_checking  # noqa: F401
+from .bt import beartype_enabled  # noqa: F401
+from .bt import set_beartype_enabled  # noqa: F401
 from .bt import beartype
 
 if TYPE_CHECKING:
@@ -299,6 +337,7 @@ class SupportsRealImagAsMethod(
     helper functions.
 
     ``` python
+    >>> import sympy
     >>> from typing import Any, Tuple, TypeVar
     >>> from numerary.types import SupportsRealImagAsMethod, real, imag
     >>> MyRealImagAsMethodT = TypeVar("MyRealImagAsMethodT", bound=SupportsRealImagAsMethod)
@@ -1426,14 +1465,13 @@ def real(operand: SupportsRealImagMixedU):
     and
     [SupportsRealImagAsMethod][numerary.types.SupportsRealImagAsMethod].
     """
-    if callable(getattr(operand, "as_real_imag", None)):
-        real_part, _ = operand.as_real_imag()  # type: ignore [union-attr]
+    operand_t = type(operand)
+    accessor = _real_accessors.get(operand_t)
 
-        return real_part
-    elif hasattr(operand, "real"):
-        return operand.real  # type: ignore [union-attr]
-    else:
-        raise TypeError(f"{operand!r} has no real or as_real_imag")
+    if accessor is None:
+        accessor = _real_accessors[operand_t] = _real_imag_accessor(operand, 0, "real")
+
+    return accessor(operand)
 
 
 @beartype
@@ -1456,14 +1494,72 @@ def imag(operand: SupportsRealImagMixedU):
     and
     [SupportsRealImagAsMethod][numerary.types.SupportsRealImagAsMethod].
     """
-    if callable(getattr(operand, "as_real_imag", None)):
-        _, imag_part = operand.as_real_imag()  # type: ignore [union-attr]
+    operand_t = type(operand)
+    accessor = _imag_accessors.get(operand_t)
+
+    if accessor is None:
+        accessor = _imag_accessors[operand_t] = _real_imag_accessor(operand, 1, "imag")
+
+    return accessor(operand)
 
-        return imag_part
-    elif hasattr(operand, "imag"):
-        return operand.imag  # type: ignore [union-attr]
-    else:
-        raise TypeError(f"{operand!r} has no real or as_real_imag")
+
+@beartype
+def real_imag_many(values: Iterable[SupportsRealImagMixedU]):
+    r"""
+    Batch version of [``real``][numerary.types.real] and
+    [``imag``][numerary.types.imag] that returns a 2-tuple of the real parts and
+    imaginary parts of *values*.
+
+    If *values* is a ``numpy`` array, its ``#!python real`` and ``#!python imag``
+    attributes are returned (which, for non-object arrays, are views rather than
+    copies). Arrays of objects result in arrays of objects of the same shape.
+    Otherwise, two lists are returned. How to extract each part is determined only
+    once per type.
+
+    ``` python
+    >>> import sympy
+    >>> from numerary.types import real_imag_many
+    >>> real_imag_many([1, 2.5, 3 + 4j, sympy.Float(5.5)])
+    ([1, 2.5, 3.0, 5.50000000000000], [0, 0.0, 4.0, 0])
+
+    >>> import numpy
+    >>> reals, imags = real_imag_many(numpy.array([1 + 2j, 3 - 4j]))
+    >>> reals, imags
+    (array([1., 3.]), array([ 2., -4.]))
+
+    ```
+    """
+    numpy = _numpy()
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        if values.dtype.kind != "O":
+            return values.real, values.imag
+
+        real_parts, imag_parts = real_imag_many(values.flat)
+        real_arr = numpy.empty(values.shape, dtype=object)
+        real_arr.flat[:] = real_parts
+        imag_arr = numpy.empty(values.shape, dtype=object)
+        imag_arr.flat[:] = imag_parts
+
+        return real_arr, imag_arr
+
+    real_parts = []
+    imag_parts = []
+    append_real = real_parts.append
+    append_imag = imag_parts.append
+
+    for value in values:
+        value_t = type(value)
+        accessor = _real_imag_accessors.get(value_t)
+
+        if accessor is None:
+            accessor = _real_imag_accessors[value_t] = _real_imag_pair_accessor(value)
+
+        real_part, imag_part = accessor(value)
+        append_real(real_part)
+        append_imag(imag_part)
+
+    return real_parts, imag_parts
 
 
 # TODO(posita): Are these sufficient? Could these be more specific? See:
@@ -1561,6 +1657,65 @@ def __pow__(
     return pow(arg, exponent, modulus)
 
 
+@beartype
+def pow_many(
+    args: Iterable[Union[SupportsComplexPow, SupportsIntegralPow]],
+    exponents: Iterable[Any],
+    modulus: Optional[Any] = None,
+):
+    r"""
+    Batch version of [``__pow__``][numerary.types.__pow__] that raises each of *args*
+    to the corresponding power in *exponents* under a shared *modulus*, returning a list
+    of the results. *args* and *exponents* must be the same length. Each value is
+    subject to the same errors as its [``__pow__``][numerary.types.__pow__]
+    counterpart.
+
+    If either *args* or *exponents* is a ``numpy`` array, the two are broadcast against
+    each other and the result is an array of that shape. Where both are integer arrays,
+    no exponent is negative, and *modulus* is a positive integer small enough that the
+    product of any two residues fits in 64 bits, results are computed via vectorized
+    square-and-multiply and returned as a ``#!python numpy.int64`` array. Otherwise,
+    results are computed element-wise into an array of objects.
+
+    ``` python
+    >>> from decimal import Decimal
+    >>> from numerary.types import pow_many
+    >>> pow_many([2, 3, Decimal("4")], [10, 200, 3], 1000)
+    [24, 1, Decimal('64')]
+    >>> pow_many([2, Decimal("1.2")], [1, 1], 2)
+    Traceback (most recent call last):
+      ...
+    decimal.InvalidOperation: [<class 'decimal.InvalidOperation'>]
+    >>> pow_many([complex(2)], [1], 1)
+    Traceback (most recent call last):
+      ...
+    ValueError: complex modulo
+
+    >>> import numpy
+    >>> pow_many(numpy.array([2, 3, 4]), numpy.array([10, 200, 3]), 1000)
+    array([24,  1, 64])
+
+    ```
+    """
+    numpy = _numpy()
+
+    if numpy is not None and (
+        isinstance(args, numpy.ndarray) or isinstance(exponents, numpy.ndarray)
+    ):
+        return _pow_many_ndarray(numpy, args, exponents, modulus)
+
+    results: List[Any] = []
+    append = results.append
+
+    for arg, exponent in zip_longest(args, exponents, fillvalue=_MISSING):
+        if arg is _MISSING or exponent is _MISSING:
+            raise ValueError("args and exponents must be the same length")
+
+        append(pow(arg, exponent, modulus))
+
+    return results
+
+
 @beartype
 def __trunc__(operand: Union[SupportsFloat, SupportsTrunc]):
     r"""
@@ -1633,6 +1788,70 @@ def __ceil__(operand: Union[SupportsFloat, SupportsFloorCeil]):
     return math.ceil(operand)  # type: ignore [arg-type]
 
 
+@beartype
+def trunc_many(values: Iterable[Union[SupportsFloat, SupportsTrunc]]):
+    r"""
+    Batch version of [``__trunc__``][numerary.types.__trunc__]. See
+    [``floor_many``][numerary.types.floor_many] for details.
+
+    ``` python
+    >>> from numerary.types import trunc_many
+    >>> list(trunc_many([-1.5, 1.5]))
+    [-1, 1]
+
+    ```
+    """
+    return _integral_many(values, math.trunc, "trunc")
+
+
+@beartype
+def floor_many(values: Iterable[Union[SupportsFloat, SupportsFloorCeil]]):
+    r"""
+    Batch version of [``__floor__``][numerary.types.__floor__].
+
+    If *values* is a ``numpy`` array of floats, the result is computed via
+    ``#!python numpy.floor`` and returned as a ``#!python numpy.int64`` array of the
+    same shape (or an array of ``#!python int`` objects if any result does not fit in
+    64 bits). Integer arrays are returned as copies, and boolean arrays are converted to
+    ``#!python numpy.int64``. As with ``math.floor``, NaNs raise ``ValueError``s and
+    infinities raise ``OverflowError``s. Any other array results in an array of objects
+    of the same shape computed element-wise.
+
+    Otherwise, an iterator is returned that lazily computes each result as *values* is
+    consumed.
+
+    ``` python
+    >>> from fractions import Fraction
+    >>> from numerary.types import floor_many
+    >>> list(floor_many([-1.5, Fraction(1, 2), 2]))
+    [-2, 0, 2]
+
+    >>> import numpy
+    >>> floor_many(numpy.array([[-1.5, 0.5], [1.5, 2.0]]))
+    array([[-2,  0],
+           [ 1,  2]])
+
+    ```
+    """
+    return _integral_many(values, math.floor, "floor")
+
+
+@beartype
+def ceil_many(values: Iterable[Union[SupportsFloat, SupportsFloorCeil]]):
+    r"""
+    Batch version of [``__ceil__``][numerary.types.__ceil__]. See
+    [``floor_many``][numerary.types.floor_many] for details.
+
+    ``` python
+    >>> from numerary.types import ceil_many
+    >>> list(ceil_many([-1.5, 1.5]))
+    [-1, 2]
+
+    ```
+    """
+    return _integral_many(values, math.ceil, "ceil")
+
+
 @beartype
 def numerator(operand: SupportsNumeratorDenominatorMixedU):
     r"""
@@ -1653,13 +1872,15 @@ def numerator(operand: SupportsNumeratorDenominatorMixedU):
     and
     [SupportsNumeratorDenominatorMethods][numerary.types.SupportsNumeratorDenominatorMethods].
     """
-    if hasattr(operand, "numerator"):
-        if callable(operand.numerator):
-            return operand.numerator()
-        else:
-            return operand.numerator
-    else:
-        raise TypeError(f"{operand!r} has no numerator")
+    operand_t = type(operand)
+    accessor = _numerator_accessors.get(operand_t)
+
+    if accessor is None:
+        accessor = _numerator_accessors[operand_t] = _rational_accessor(
+            operand, "numerator"
+        )
+
+    return accessor(operand)
 
 
 @beartype
@@ -1682,85 +1903,332 @@ def denominator(operand: SupportsNumeratorDenominatorMixedU):
     and
     [SupportsNumeratorDenominatorMethods][numerary.types.SupportsNumeratorDenominatorMethods].
     """
-    if hasattr(operand, "denominator"):
-        if callable(operand.denominator):
-            return operand.denominator()
+    operand_t = type(operand)
+    accessor = _denominator_accessors.get(operand_t)
+
+    if accessor is None:
+        accessor = _denominator_accessors[operand_t] = _rational_accessor(
+            operand, "denominator"
+        )
+
+    return accessor(operand)
+
+
+@beartype
+def numerator_denominator_many(values: Iterable[Any]):
+    r"""
+    Batch version of [``numerator``][numerary.types.numerator] and
+    [``denominator``][numerary.types.denominator] that returns a 2-tuple of the
+    numerators and denominators of *values* in a single pass. Values without
+    numerators and denominators (e.g., ``#!python float``s or ``#!python Decimal``s)
+    are converted via their ``as_integer_ratio`` methods, if available. How to extract
+    each part is determined only once per type.
+
+    Both parts are returned as [``array("q")``](https://docs.python.org/3/library/array.html)
+    buffers of signed 64-bit integers, or as lists of ``#!python int``s if any part
+    does not fit. If *values* is a ``numpy`` array, they are returned as
+    ``#!python numpy.int64`` arrays (or arrays of objects if any part does not fit) of
+    the same shape.
+
+    ``` python
+    >>> from fractions import Fraction
+    >>> from numerary.types import numerator_denominator_many
+    >>> numerator_denominator_many([Fraction(22, 7), 3, 0.75])
+    (array('q', [22, 3, 3]), array('q', [7, 1, 4]))
+    >>> numerator_denominator_many([Fraction(2 ** 64, 3), 1.5])
+    ([18446744073709551616, 3], [3, 2])
+
+    ```
+    """
+    numpy = _numpy()
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _numerator_denominator_ndarray(numpy, values)
+
+    numerators: Any = array("q")
+    denominators: Any = array("q")
+
+    for value in values:
+        value_t = type(value)
+        accessor = _numerator_denominator_accessors.get(value_t)
+
+        if accessor is None:
+            accessor = _numerator_denominator_pair_accessor(value)
+            _numerator_denominator_accessors[value_t] = accessor
+
+        numerator_part, denominator_part = accessor(value)
+
+        try:
+            numerators.append(numerator_part)
+            denominators.append(denominator_part)
+        except OverflowError:
+            # Fall back to lists for this and all remaining values
+            if len(numerators) > len(denominators):
+                numerators.pop()
+
+            numerators = numerators.tolist()
+            denominators = denominators.tolist()
+            numerators.append(numerator_part)
+            denominators.append(denominator_part)
+
+    if isinstance(numerators, list):
+        # Parts appended after falling back may be other integral types
+        numerators = list(map(index, numerators))
+        denominators = list(map(index, denominators))
+
+    return numerators, denominators
+
+
+def _real_imag_accessor(operand: Any, index: int, attr_name: str) -> Callable:
+    if callable(getattr(operand, "as_real_imag", None)):
+
+        def _as_real_imag_part(operand: Any) -> Any:
+            return operand.as_real_imag()[index]
+
+        return _as_real_imag_part
+    elif hasattr(operand, attr_name):
+        return attrgetter(attr_name)
+    else:
+        raise TypeError(f"{operand!r} has no {attr_name} or as_real_imag")
+
+
+def _real_imag_pair_accessor(operand: Any) -> Callable:
+    if callable(getattr(operand, "as_real_imag", None)):
+        return methodcaller("as_real_imag")
+    elif hasattr(operand, "real") and hasattr(operand, "imag"):
+        return attrgetter("real", "imag")
+    else:
+        raise TypeError(f"{operand!r} has no real and imag or as_real_imag")
+
+
+def _integral_many(values: Iterable[Any], math_func: Callable, ufunc_name: str) -> Any:
+    numpy = _numpy()
+
+    if numpy is None or not isinstance(values, numpy.ndarray):
+        return map(math_func, values)
+
+    kind = values.dtype.kind
+
+    if kind == "b":
+        return values.astype(numpy.int64)
+    elif kind in "iu":
+        return values.copy()
+    elif kind == "f":
+        results = getattr(numpy, ufunc_name)(values)
+
+        if results.size == 0:
+            return results.astype(numpy.int64)
+
+        finite = numpy.isfinite(results)
+
+        if not finite.all():
+            # Let math raise the same errors it would for the scalar
+            math_func(results[~finite].flat[0])
+
+        # Compare against bounds in a type that represents them exactly (float16, for
+        # one, can't, so comparing in it would overflow)
+        bound = (
+            numpy.float64(2**63)
+            if results.dtype.itemsize <= 8
+            else results.dtype.type(2**63)
+        )
+
+        if -bound <= results.min() and results.max() < bound:
+            return results.astype(numpy.int64)
+
+    integral_arr = numpy.empty(values.shape, dtype=object)
+    integral_arr.flat[:] = list(map(math_func, values.flat))
+
+    return integral_arr
+
+
+def _pow_many_ndarray(
+    numpy: ModuleType, args: Any, exponents: Any, modulus: Optional[Any]
+) -> Any:
+    args, exponents = numpy.broadcast_arrays(args, exponents)
+
+    if (
+        args.dtype.kind in "biu"
+        and exponents.dtype.kind in "biu"
+        and isinstance(modulus, (int, numpy.integer))
+        and 0 < modulus
+        and (int(modulus) - 1) ** 2 < 2**63
+        and (exponents.size == 0 or exponents.min() >= 0)
+    ):
+        modulus = int(modulus)
+        results = numpy.full(args.shape, 1 % modulus, dtype=numpy.int64)
+        factors = (args % modulus).astype(numpy.int64)
+        exponents = exponents.astype(numpy.uint64)
+        bits = numpy.empty(args.shape, dtype=numpy.int64)
+        multipliers = numpy.empty(args.shape, dtype=numpy.int64)
+        max_exponent = int(exponents.max()) if exponents.size else 0
+
+        # Residues are less than modulus, so no product can overflow. Multiplying
+        # everything by either its factor or one (rather than selecting only those
+        # with the bit set) avoids fancy indexing and temporaries.
+        for i in range(max_exponent.bit_length()):
+            numpy.bitwise_and(
+                exponents >> numpy.uint64(i),
+                numpy.uint64(1),
+                out=bits,
+                casting="unsafe",
+            )
+            numpy.multiply(factors, bits, out=multipliers)
+            multipliers += 1 - bits
+            results *= multipliers
+            results %= modulus
+            factors *= factors
+            factors %= modulus
+
+        return results
+
+    # Converting to lists yields Python scalars (numpy's integers do not support
+    # three-argument pow)
+    results = numpy.empty(args.shape, dtype=object)
+    results.flat[:] = [
+        pow(arg, exponent, modulus)
+        for arg, exponent in zip(args.ravel().tolist(), exponents.ravel().tolist())
+    ]
+
+    return results
+
+
+def _numerator_denominator_pair_accessor(operand: Any) -> Callable:
+    if hasattr(operand, "numerator") and hasattr(operand, "denominator"):
+        if callable(operand.numerator):
+
+            def _numerator_denominator_methods(operand: Any) -> Tuple[Any, Any]:
+                return operand.numerator(), operand.denominator()
+
+            return _numerator_denominator_methods
         else:
-            return operand.denominator
+            return attrgetter("numerator", "denominator")
+    elif callable(getattr(operand, "as_integer_ratio", None)):
+        return methodcaller("as_integer_ratio")
     else:
-        raise TypeError(f"{operand!r} has no denominator")
+        raise TypeError(
+            f"{operand!r} has no numerator and denominator or as_integer_ratio"
+        )
+
+
+def _numerator_denominator_ndarray(numpy: ModuleType, values: Any) -> Tuple[Any, Any]:
+    if values.dtype.kind in "biu":
+        numerators = values.astype(numpy.int64)
+
+        # Only unsigned 64-bit integers can be too big
+        if (
+            values.dtype.kind != "u"
+            or values.dtype.itemsize < 8
+            or (numerators >= 0).all()
+        ):
+            return numerators, numpy.ones(values.shape, dtype=numpy.int64)
+
+    numerators, denominators = numerator_denominator_many(values.flat)
+
+    if isinstance(numerators, array):
+        return (
+            numpy.frombuffer(numerators, dtype=numpy.int64).reshape(values.shape),
+            numpy.frombuffer(denominators, dtype=numpy.int64).reshape(values.shape),
+        )
+    else:
+        numerator_arr = numpy.empty(values.shape, dtype=object)
+        numerator_arr.flat[:] = numerators
+        denominator_arr = numpy.empty(values.shape, dtype=object)
+        denominator_arr.flat[:] = denominators
+
+        return numerator_arr, denominator_arr
+
+
+def _rational_accessor(operand: Any, attr_name: str) -> Callable:
+    if hasattr(operand, attr_name):
+        if callable(getattr(operand, attr_name)):
+            return methodcaller(attr_name)
+        else:
+            return attrgetter(attr_name)
+    else:
+        raise TypeError(f"{operand!r} has no {attr_name}")
+
+
+_MISSING: Any = object()
+
+# How to access each part is resolved once per type (e.g., via property, via method,
+# or via as_real_imag) and cached here
+_real_accessors: Dict[Type, Callable] = _weakly_keyed({})
+_imag_accessors: Dict[Type, Callable] = _weakly_keyed({})
+_real_imag_accessors: Dict[Type, Callable] = _weakly_keyed({})
+_numerator_denominator_accessors: Dict[Type, Callable] = _weakly_keyed({})
+_numerator_accessors: Dict[Type, Callable] = _weakly_keyed({})
+_denominator_accessors: Dict[Type, Callable] = _weakly_keyed({})
 
 
 # ---- Initialization ------------------------------------------------------------------
 
 
-try:
-    # Register known numpy exceptions
-    import numpy
-except ImportError:
-    pass
-except Exception as exc:
-    logging.getLogger(__name__).warning(
-        f"unexpected error when attempting to load numpy ({exc})"
+# Known numpy and sympy exceptions are registered once those libraries are imported
+# (if ever) by whoever is using us rather than importing them ourselves, which can be
+# slow
+
+
+@when_imported("numpy")
+def _register_numpy(numpy: ModuleType) -> None:
+    def _types(*t_names: str) -> List[Type]:
+        return [
+            getattr(numpy, t_name)
+            for t_name in t_names
+            if getattr(numpy, t_name, None) is not None
+        ]
+
+    # Hooks run wherever numpy is first imported, which could be in a
+    # batch_overrides block that raises, so these take effect immediately
+    _change_overrides(
+        _override_changes(
+            _types(
+                "uint8",
+                "uint16",
+                "uint32",
+                "uint64",
+                "int8",
+                "int16",
+                "int32",
+                "int64",
+            ),
+            include=[SupportsFloorCeil],
+        )
+        + _override_changes(
+            _types(
+                "float16",
+                "float32",
+                "float64",
+                "float128",
+            ),
+            include=[SupportsFloorCeil],
+            exclude=[SupportsIntegralOps, SupportsIntegralPow],
+        )
+        # numpy complex types define these methods, but only to raise exceptions
+        + _override_changes(
+            _types(
+                "csingle",
+                "cdouble",
+                "clongdouble",
+            ),
+            exclude=[
+                SupportsDivmod,
+                SupportsRealOps,
+                SupportsIntegralOps,
+                SupportsIntegralPow,
+            ],
+        ),
+        batched=False,
     )
-    logging.getLogger(__name__).debug(traceback.format_exc())
-else:
-    t: Optional[Type]
-
-    for t_name in (
-        "uint8",
-        "uint16",
-        "uint32",
-        "uint64",
-        "int8",
-        "int16",
-        "int32",
-        "int64",
-    ):
-        t = getattr(numpy, t_name, None)
 
-        if t is not None:
-            SupportsFloorCeil.includes(t)
 
-    for t_name in (
-        "float16",
-        "float32",
-        "float64",
-        "float128",
-    ):
-        t = getattr(numpy, t_name, None)
-
-        if t is not None:
-            SupportsFloorCeil.includes(t)
-            SupportsIntegralOps.excludes(t)
-            SupportsIntegralPow.excludes(t)
-
-    # numpy complex types define these methods, but only to raise exceptions
-    for t_name in (
-        "csingle",
-        "cdouble",
-        "clongdouble",
-    ):
-        t = getattr(numpy, t_name, None)
-
-        if t is not None:
-            SupportsDivmod.excludes(t)
-            SupportsRealOps.excludes(t)
-            SupportsIntegralOps.excludes(t)
-            SupportsIntegralPow.excludes(t)
-
-
-try:
-    # Register known sympy exceptions
-    import sympy
-except ImportError:
-    pass
-except Exception as exc:
-    logging.getLogger(__name__).warning(
-        f"unexpected error when attempting to load sympy ({exc})"
+@when_imported("sympy")
+def _register_sympy(sympy: ModuleType) -> None:
+    # See _register_numpy
+    _change_overrides(
+        _override_changes(
+            sympy.Symbol,
+            exclude=[SupportsTrunc, SupportsIntegralOps, SupportsIntegralPow],
+        ),
+        batched=False,
     )
-    logging.getLogger(__name__).debug(traceback.format_exc())
-else:
-    SupportsTrunc.excludes(sympy.Symbol)
-    SupportsIntegralOps.excludes(sympy.Symbol)
-    SupportsIntegralPow.excludes(sympy.Symbol)
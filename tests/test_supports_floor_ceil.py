@@ -11,12 +11,18 @@ from __future__ import annotations
 import sys
 from decimal import Decimal
 from fractions import Fraction
-from typing import cast
+from typing import Any, List, cast
 
 import pytest
 from beartype import beartype, roar
 
-from numerary.types import SupportsFloorCeil, __ceil__, __floor__
+from numerary.types import (
+    SupportsFloorCeil,
+    __ceil__,
+    __floor__,
+    ceil_many,
+    floor_many,
+)
 
 from .numberwang import (
     Numberwang,
@@ -95,6 +101,29 @@ def test_floor_ceil_float() -> None:
             assert __ceil__(good_val), f"{good_val!r}"
 
 
+def test_floor_ceil_many() -> None:
+    values: List[Any] = [
+        True,
+        -273,
+        -273.15,
+        Fraction(-27315, 100),
+        Decimal("-273.15"),
+        TestIntEnum.ZERO,
+        Numberwang(-273),
+        Wangernumb(-273.15),
+    ]
+
+    for many_func, scalar_func in ((floor_many, __floor__), (ceil_many, __ceil__)):
+        results = many_func(iter(values))
+        assert not isinstance(results, list)
+        assert list(results) == [scalar_func(val) for val in values]
+        assert list(many_func([])) == []
+
+        # beartype (if enabled) objects first
+        with pytest.raises((TypeError, roar.BeartypeException)):
+            list(many_func(["-273.15"]))  # type: ignore [list-item]
+
+
 def test_floor_ceil_beartype() -> None:
     for good_val in (
         True,
@@ -172,6 +201,42 @@ def test_floor_ceil_numpy() -> None:
         assert not isinstance(bad_val, SupportsFloorCeil), f"{bad_val!r}"
 
 
+@pytest.mark.filterwarnings("error")  # e.g., overflows in range checks
+def test_floor_ceil_many_numpy() -> None:
+    numpy = pytest.importorskip("numpy", reason="requires numpy")
+
+    for many_func, scalar_func in ((floor_many, __floor__), (ceil_many, __ceil__)):
+        for dtype in (numpy.float16, numpy.float32, numpy.float64, numpy.longdouble):
+            values = numpy.array(
+                [[-273.15, -0.5, 0.0], [0.5, 1.5, 273.15]], dtype=dtype
+            )
+            results = many_func(values)
+            assert results.dtype == numpy.int64
+            assert results.tolist() == [
+                [scalar_func(val) for val in row] for row in values.tolist()
+            ]
+
+        values = numpy.array([-1e300, 1e300])
+        results = many_func(values)
+        assert results.dtype == object
+        assert results.tolist() == [scalar_func(val) for val in values.tolist()]
+
+        for dtype in (numpy.bool_, numpy.uint8, numpy.int16, numpy.uint64):
+            values = numpy.array([0, 1, 1], dtype=dtype)
+            results = many_func(values)
+            assert results.dtype.kind in "iu"
+            assert results.tolist() == [0, 1, 1]
+            assert results is not values
+
+        assert many_func(numpy.array([], dtype=numpy.float64)).tolist() == []
+
+        with pytest.raises(ValueError):
+            many_func(numpy.array([1.5, numpy.nan]))
+
+        with pytest.raises(OverflowError):
+            many_func(numpy.array([1.5, -numpy.inf]))
+
+
 def test_floor_ceil_numpy_beartype() -> None:
     pytest.importorskip("numpy", reason="requires numpy")
     import numpy
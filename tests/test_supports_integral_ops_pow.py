@@ -10,12 +10,17 @@ from __future__ import annotations
 
 from decimal import Decimal
 from fractions import Fraction
-from typing import cast
+from typing import Any, List, cast
 
 import pytest
 from beartype import beartype, roar
 
-from numerary.types import SupportsIntegralOps, SupportsIntegralPow
+from numerary.types import (
+    SupportsIntegralOps,
+    SupportsIntegralPow,
+    __pow__,
+    pow_many,
+)
 
 from .numberwang import (
     Numberwang,
@@ -110,6 +115,27 @@ def test_supports_integral_ops_pow() -> None:
         assert not isinstance(bad_val, SupportsIntegralOps), f"{bad_val!r}"
 
 
+def test_pow_many() -> None:
+    args: List[Any] = [True, -273, Decimal("-273"), Numberwang(-273), 2**100]
+    exponents = [3, 5, 2, 3, 7]
+
+    for modulus in (None, 1, 7, -7, 2**64 + 13):
+        assert pow_many(args, exponents, modulus) == [
+            __pow__(arg, exponent, modulus) for arg, exponent in zip(args, exponents)
+        ]
+
+    assert pow_many(iter(args), iter(exponents), 7) == pow_many(args, exponents, 7)
+    assert pow_many([], [], 7) == []
+    assert pow_many([3], [-1], 7) == [5]
+
+    for bad_args, bad_exponents in (([1, 2], [1]), ([1], [1, 2])):
+        with pytest.raises(ValueError):
+            pow_many(bad_args, bad_exponents, 7)
+
+    with pytest.raises(ValueError):
+        pow_many([complex(2)], [1], 7)
+
+
 def test_supports_integral_ops_pow_beartype() -> None:
     for good_val in (
         True,
@@ -190,6 +216,45 @@ def test_supports_integral_ops_pow_numpy() -> None:
         assert not isinstance(bad_val, SupportsIntegralPow), f"{bad_val!r}"
 
 
+def test_pow_many_numpy() -> None:
+    numpy = pytest.importorskip("numpy", reason="requires numpy")
+
+    args = numpy.arange(-50, 50, dtype=numpy.int64).reshape(10, 10)
+    exponents = numpy.arange(0, 10000, 100, dtype=numpy.int64).reshape(10, 10)
+
+    for modulus in (1, 2, 1000, numpy.int32(1009), 3037000500):
+        results = pow_many(args, exponents, modulus)
+        assert results.dtype == numpy.int64
+        assert results.shape == (10, 10)
+        assert results.tolist() == [
+            [pow(arg, exponent, int(modulus)) for arg, exponent in zip(*row)]
+            for row in zip(args.tolist(), exponents.tolist())
+        ]
+
+    # Broadcasting and other integer types
+    results = pow_many(numpy.array([2, 3], dtype=numpy.uint64), [[4], [5]], 10)
+    assert results.dtype == numpy.int64
+    assert results.tolist() == [[6, 1], [2, 3]]
+
+    # Anything that might not fit falls back to objects
+    for big_args, big_exponents, big_modulus in (
+        (args, exponents, 3037000501),
+        (args, exponents, -1000),
+        (args, exponents, None),
+        (args * 2 + 1, -exponents, 1009),
+        (args.astype(object), exponents, 1000),
+    ):
+        results = pow_many(big_args, big_exponents, big_modulus)
+        assert results.dtype == object
+        assert results.tolist() == [
+            [pow(arg, exponent, big_modulus) for arg, exponent in zip(*row)]
+            for row in zip(big_args.tolist(), big_exponents.tolist())
+        ]
+
+    with pytest.raises(TypeError):
+        pow_many(numpy.array([2.0, 3.0]), numpy.array([1, 1]), 7)
+
+
 def test_supports_integral_ops_pow_numpy_beartype() -> None:
     pytest.importorskip("numpy", reason="requires numpy")
     import numpy
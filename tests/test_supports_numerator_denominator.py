@@ -8,6 +8,9 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
+from array import array
 from decimal import Decimal
 from fractions import Fraction
 from typing import cast
@@ -22,6 +25,7 @@ from numerary.types import (
     SupportsNumeratorDenominatorMixedU,
     denominator,
     numerator,
+    numerator_denominator_many,
 )
 
 from .numberwang import (
@@ -120,6 +124,64 @@ def test_numerator_denominator() -> None:
         ), f"{bad_val!r}"
 
 
+def test_numerator_denominator_accessors() -> None:
+    for _ in range(2):  # the second time through uses cached accessors
+        assert numerator(Fraction(-27315, 100)) == -5463
+        assert denominator(Fraction(-27315, 100)) == 20
+        assert numerator(SageLikeRational(-27315, 100)) == -27315
+        assert denominator(SageLikeRational(-27315, 100)) == 100
+
+        # beartype (if enabled) objects first
+        with pytest.raises((TypeError, roar.BeartypeException)):
+            numerator(-273.15)  # type: ignore [arg-type]
+
+    # Cached accessors don't keep classes alive
+    sage_like_t = type("SageLikeRationalDerived", (SageLikeRational,), {})
+    assert numerator(sage_like_t(-27315, 100)) == -27315
+    sage_like_t_ref = weakref.ref(sage_like_t)
+    del sage_like_t
+    gc.collect()
+    assert sage_like_t_ref() is None
+
+
+def test_numerator_denominator_many() -> None:
+    values = [
+        True,
+        -273,
+        Fraction(-27315, 100),
+        SageLikeRational(-27315, 100),
+        -273.15,
+        Decimal("-273.15"),
+    ]
+    expected_numerators = [1, -273, -5463, -27315, -2402652809016115, -5463]
+    expected_denominators = [1, 1, 20, 100, 8796093022208, 20]
+    numerators, denominators = numerator_denominator_many(values)
+    assert isinstance(numerators, array) and numerators.typecode == "q"
+    assert isinstance(denominators, array) and denominators.typecode == "q"
+    assert numerators.tolist() == expected_numerators
+    assert denominators.tolist() == expected_denominators
+    assert numerator_denominator_many(iter(values)) == (numerators, denominators)
+    assert numerator_denominator_many(()) == (array("q"), array("q"))
+
+    # Parts that don't fit in 64 bits result in lists of ints
+    for big_val in (Fraction(2**64, 3), Fraction(3, 2**64)):
+        numerators, denominators = numerator_denominator_many(
+            values + [big_val] + values
+        )
+        assert (
+            numerators
+            == expected_numerators + [big_val.numerator] + expected_numerators
+        )
+        assert (
+            denominators
+            == expected_denominators + [big_val.denominator] + expected_denominators
+        )
+
+    # beartype (if enabled) objects first
+    with pytest.raises(TypeError):
+        numerator_denominator_many(["-273"])
+
+
 def test_numerator_denominator_beartype() -> None:
     for good_val in (
         True,
@@ -200,6 +262,29 @@ def test_numerator_denominator_numpy() -> None:
         ), f"{bad_val!r}"
 
 
+def test_numerator_denominator_many_numpy() -> None:
+    numpy = pytest.importorskip("numpy", reason="requires numpy")
+
+    for dtype in (numpy.bool_, numpy.uint8, numpy.int16, numpy.uint64, numpy.int64):
+        values = (numpy.arange(6) % 2).astype(dtype).reshape(2, 3)
+        numerators, denominators = numerator_denominator_many(values)
+        assert numerators.dtype == denominators.dtype == numpy.int64
+        assert numerators.tolist() == values.tolist()
+        assert denominators.tolist() == [[1] * 3] * 2
+
+    values = numpy.array([[-273.15, 0.5], [0.25, 2.0]], dtype=numpy.float64)
+    numerators, denominators = numerator_denominator_many(values)
+    assert numerators.dtype == denominators.dtype == numpy.int64
+    assert numerators.tolist() == [[-2402652809016115, 1], [1, 2]]
+    assert denominators.tolist() == [[8796093022208, 2], [4, 1]]
+
+    values = numpy.array([2**64 - 1, 1], dtype=numpy.uint64)
+    numerators, denominators = numerator_denominator_many(values)
+    assert numerators.dtype == denominators.dtype == object
+    assert numerators.tolist() == [2**64 - 1, 1]
+    assert denominators.tolist() == [1, 1]
+
+
 def test_numerator_denominator_numpy_beartype() -> None:
     pytest.importorskip("numpy", reason="requires numpy")
     import numpy
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 from fractions import Fraction
-from typing import cast
+from typing import Tuple, cast
 
 import pytest
 from beartype import beartype, roar
@@ -22,6 +22,7 @@ from numerary.types import (
     SupportsRealImagMixedU,
     imag,
     real,
+    real_imag_many,
 )
 
 from .numberwang import (
@@ -96,6 +97,48 @@ def test_supports_real_imag() -> None:
         assert not isinstance(bad_val, SupportsRealImagMixedT), f"{bad_val!r}"
 
 
+def test_real_imag_accessors() -> None:
+    class RealImagAsMethod:
+        def as_real_imag(self) -> Tuple[int, int]:
+            return (-273, 15)
+
+    for _ in range(2):  # the second time through uses cached accessors
+        assert real(complex(-273, 15)) == -273
+        assert imag(complex(-273, 15)) == 15
+        assert real(RealImagAsMethod()) == -273  # type: ignore [arg-type]
+        assert imag(RealImagAsMethod()) == 15  # type: ignore [arg-type]
+
+        # beartype (if enabled) objects first
+        with pytest.raises((TypeError, roar.BeartypeException)):
+            real("-273.15")  # type: ignore [arg-type]
+
+
+def test_real_imag_many() -> None:
+    class RealImagAsMethod:
+        def as_real_imag(self) -> Tuple[int, int]:
+            return (-273, 15)
+
+    values = [
+        True,
+        -273,
+        -273.15,
+        complex(-273, 15),
+        Fraction(-27315, 100),
+        RealImagAsMethod(),
+        complex(15, -273),
+    ]
+    assert real_imag_many(values) == (  # type: ignore [arg-type]
+        [True, -273, -273.15, -273.0, Fraction(-27315, 100), -273, 15.0],
+        [0, 0, 0.0, 15.0, 0, 15, -273.0],
+    )
+    assert real_imag_many(iter(values)) == real_imag_many(values)  # type: ignore [arg-type]
+    assert real_imag_many(()) == ([], [])
+
+    # beartype (if enabled) objects first
+    with pytest.raises((TypeError, roar.BeartypeException)):
+        real_imag_many(["-273.15"])  # type: ignore [list-item]
+
+
 def test_supports_real_imag_beartype() -> None:
     for good_val in (
         True,
@@ -172,6 +215,27 @@ def test_supports_real_imag_numpy() -> None:
         assert imag(good_val) is not None, f"{good_val!r}"
 
 
+def test_real_imag_many_numpy() -> None:
+    numpy = pytest.importorskip("numpy", reason="requires numpy")
+    values = numpy.array([[-273 + 15j, 15 - 273j]], dtype=numpy.cdouble)
+    real_parts, imag_parts = real_imag_many(values)
+    assert real_parts.tolist() == [[-273.0, 15.0]]
+    assert imag_parts.tolist() == [[15.0, -273.0]]
+
+    # Non-object arrays result in views
+    assert numpy.shares_memory(real_parts, values)
+    real_parts[0, 0] = 0.0
+    assert values[0, 0] == 15j
+
+    values = numpy.array(
+        [[-273, Fraction(-27315, 100)], [-273 + 15j, 0.0]], dtype=object
+    )
+    real_parts, imag_parts = real_imag_many(values)
+    assert real_parts.dtype == imag_parts.dtype == object
+    assert real_parts.tolist() == [[-273, Fraction(-27315, 100)], [-273.0, 0.0]]
+    assert imag_parts.tolist() == [[0, 0], [15.0, 0.0]]
+
+
 def test_supports_real_imag_numpy_beartype() -> None:
     pytest.importorskip("numpy", reason="requires numpy")
     import numpy
@@ -8,15 +8,62 @@
 
 from __future__ import annotations
 
-from abc import abstractmethod
-from typing import Tuple
+import asyncio
+import gc
+import inspect
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from abc import ABCMeta, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator, List, Tuple
 
 import pytest
 from beartype import beartype
 from beartype.roar import BeartypeException
 
-from numerary import IntegralLike, RealLike
-from numerary.types import CachingProtocolMeta, Protocol, runtime_checkable
+from numerary import IntegralLike, RealLike, bt
+from numerary._post_import import when_imported
+from numerary.types import (
+    CacheInfo,
+    CachingProtocolMeta,
+    Protocol,
+    RationalLike,
+    SupportsFloat,
+    SupportsIndex,
+    SupportsInt,
+    WarmInfo,
+    __floor__,
+    attach_shared_verdicts,
+    batch_overrides,
+    beartype_checking,
+    beartype_enabled,
+    cached_verdicts,
+    detach_shared_verdicts,
+    load_cached_verdicts,
+    protocoldispatch,
+    register_overrides,
+    restore_state,
+    runtime_checkable,
+    save_cached_verdicts,
+    set_beartype_enabled,
+    set_default_cache_maxsize,
+    set_stats_enabled,
+    snapshot_state,
+    stats,
+    warm,
+    worker_initializer,
+)
 
 __all__ = ()
 
@@ -47,6 +94,36 @@ class Two:
         return 2
 
 
+class Three:
+    def three(self) -> int:
+        return 3
+
+
+class Money(float):
+    pass
+
+
+# ---- Functions -----------------------------------------------------------------------
+
+
+def _derived_protocol(base: CachingProtocolMeta = SupportsOne) -> CachingProtocolMeta:
+    # Returns a new caching protocol requiring nothing more than base, so that
+    # verdicts left over from other tests don't apply to it
+    @runtime_checkable
+    class SupportsOneDerived(
+        base,  # type: ignore [misc,valid-type]
+        Protocol,
+    ):
+        pass
+
+    return SupportsOneDerived  # type: ignore [return-value]
+
+
+def _one_type() -> type:
+    # Returns a new (unnameable) type satisfying SupportsOne, for the same reason
+    return type("OneDerived", (One,), {})
+
+
 # ---- Tests ---------------------------------------------------------------------------
 
 
@@ -128,3 +205,1422 @@ def test_caching_protocol_meta_cache_overrides() -> None:
 
     SupportsOne.reset_for(Two)
     assert not isinstance(two, SupportsOne)
+
+
+def test_caching_protocol_meta_cache_maxsize() -> None:
+    @runtime_checkable
+    class SupportsBounded(
+        Protocol,
+        metaclass=CachingProtocolMeta,
+    ):
+        @abstractmethod
+        def one(self) -> int:
+            pass
+
+    assert SupportsBounded.cache_info() == CacheInfo(None, 0, 0)
+    SupportsBounded.set_cache_maxsize(2)
+    SupportsBounded.excludes(One)
+    SupportsBounded.includes(Two)
+    one_types = [type(f"One{i}", (One,), {}) for i in range(4)]
+
+    for one_t in one_types:
+        assert isinstance(one_t(), SupportsBounded)
+
+    assert SupportsBounded.cache_info() == CacheInfo(2, 4, 2)
+    assert set(SupportsBounded._abc_inst_check_cache) == {One, Two, *one_types[-2:]}
+    assert isinstance(one_types[-2](), SupportsBounded)  # most recently used
+    assert isinstance(one_types[0](), SupportsBounded)
+    assert set(SupportsBounded._abc_inst_check_cache) == {
+        One,
+        Two,
+        one_types[0],
+        one_types[-2],
+    }
+
+    assert not isinstance(One(), SupportsBounded)
+    assert isinstance(Two(), SupportsBounded)
+    SupportsBounded.reset_for(One)
+    assert isinstance(One(), SupportsBounded)
+    assert SupportsBounded.cache_info() == CacheInfo(2, 3, 1)
+
+    SupportsBounded.set_cache_maxsize(None)
+
+    for one_t in one_types:
+        assert isinstance(one_t(), SupportsBounded)
+
+    assert SupportsBounded.cache_info() == CacheInfo(None, 6, 1)
+
+    with pytest.raises(ValueError):
+        SupportsBounded.set_cache_maxsize(-1)
+
+
+def test_bounded_cache_all_pinned() -> None:
+    from numerary import _protocol
+
+    class _PinnedSinceCounted(dict):
+        # Every entry looks pinned, but none were when the cache counted them
+        def get(self, key: Any, default: Any = None) -> Any:
+            return True
+
+    cache = _protocol._BoundedCache(0, _PinnedSinceCounted())
+    cache[One] = True
+    cache[Two] = False
+    assert list(cache) == [One, Two]
+
+
+def test_set_default_cache_maxsize() -> None:
+    try:
+        set_default_cache_maxsize(1)
+        assert RealLike.cache_info().maxsize == 1
+        assert SupportsOne.cache_info().maxsize == 1
+        assert isinstance(1, RealLike)
+        assert isinstance(1.0, RealLike)
+        assert RealLike.cache_info().currsize == 1
+    finally:
+        set_default_cache_maxsize(None)
+
+    assert RealLike.cache_info().maxsize is None
+
+
+def test_caching_protocol_meta_cache_weakkeys() -> None:
+    def _make_one_type() -> type:
+        one_t = _one_type()
+        assert isinstance(one_t(), SupportsOne)
+        assert not isinstance(one_t(), RealLike)
+
+        return one_t
+
+    one_t = _make_one_type()
+    SupportsOne.excludes(one_t)
+    one_t_ref = weakref.ref(one_t)
+    gc.collect()
+    assert not isinstance(one_t(), SupportsOne)
+    del one_t
+    gc.collect()
+    assert one_t_ref() is None
+
+    SupportsOne.set_cache_weakkeys(False)
+
+    try:
+        one_t_ref = weakref.ref(_make_one_type())
+        gc.collect()
+        assert one_t_ref() is not None
+        SupportsOne.reset_for(one_t_ref())  # type: ignore [arg-type]
+    finally:
+        SupportsOne.set_cache_weakkeys(True)
+
+    gc.collect()
+    assert one_t_ref() is None
+
+
+def test_cached_verdicts_during_gc() -> None:
+    one_t = _one_type()
+    SupportsOne.excludes(one_t)
+    finalized: List[bool] = []
+
+    class _Finalized:
+        def __init__(self) -> None:
+            self.cycle = self
+
+        def __del__(self) -> None:
+            finalized.append(isinstance(one_t(), RealLike))
+
+    try:
+        _Finalized()
+        gc.collect()
+        assert finalized == [False]
+
+        # Verdicts recorded during a full collection don't clobber those parked for it
+        verdicts = cached_verdicts(one_t)
+        assert verdicts[SupportsOne] is False
+        assert verdicts[RealLike] is False
+    finally:
+        SupportsOne.reset_for(one_t)
+
+
+def test_protocol_indexes_reused() -> None:
+    from numerary import _protocol
+
+    SupportsOneDerived = _derived_protocol()
+    index = SupportsOneDerived._abc_inst_check_index
+    one_t = _one_type()
+    assert isinstance(one_t(), SupportsOneDerived)
+    del SupportsOneDerived
+    gc.collect()
+    num_protocols = len(_protocol._protocols_by_index)
+
+    # Verdicts of collected protocols don't carry over to those reusing their indexes
+    SupportsOneDerived = _derived_protocol()
+    assert SupportsOneDerived._abc_inst_check_index == index
+    assert len(_protocol._protocols_by_index) == num_protocols
+    assert SupportsOneDerived not in cached_verdicts(one_t)
+    assert isinstance(one_t(), SupportsOneDerived)
+
+    # Don't leave it around to share verdicts with protocols in other tests (see
+    # test_component_verdicts)
+    del SupportsOneDerived
+    gc.collect()
+
+
+def test_cached_verdicts() -> None:
+    SupportsOneDerived = _derived_protocol()
+    one_t = _one_type()
+    assert cached_verdicts(one_t) == {}
+    assert isinstance(one_t(), SupportsOneDerived)
+    assert cached_verdicts(one_t) == {SupportsOne: True, SupportsOneDerived: True}
+    assert not isinstance(one_t(), RealLike)
+    assert not cached_verdicts(one_t)[RealLike]
+
+    SupportsOne.excludes(one_t)
+    assert not cached_verdicts(one_t)[SupportsOne]
+    assert SupportsOneDerived not in cached_verdicts(one_t)
+    assert not isinstance(one_t(), SupportsOneDerived)
+    SupportsOne.reset_for(one_t)
+    assert SupportsOne not in cached_verdicts(one_t)
+    assert SupportsOneDerived not in cached_verdicts(one_t)
+
+    SupportsOneDerived.set_cache_maxsize(0)
+    assert isinstance(one_t(), SupportsOneDerived)
+    assert SupportsOneDerived.cache_info().currsize == 0
+    assert cached_verdicts(one_t)[SupportsOneDerived]
+    assert isinstance(one_t(), SupportsOneDerived)
+
+
+def test_transitive_invalidation() -> None:
+    SupportsOneMiddle = _derived_protocol()
+    SupportsOneTop = _derived_protocol(SupportsOneMiddle)
+    one_t = _one_type()
+    assert isinstance(one_t(), SupportsOneTop)
+    SupportsOne.excludes(one_t)
+    assert SupportsOneMiddle not in cached_verdicts(one_t)
+    assert SupportsOneTop not in cached_verdicts(one_t)
+    assert not isinstance(one_t(), SupportsOneTop)
+    SupportsOne.reset_for(one_t)
+    assert SupportsOneTop not in cached_verdicts(one_t)
+    assert isinstance(one_t(), SupportsOneTop)
+
+    # Overrides in between shield what derives from them
+    SupportsOneMiddle.includes(one_t)
+    assert isinstance(one_t(), SupportsOneTop)
+    SupportsOne.excludes(one_t)
+    assert cached_verdicts(one_t)[SupportsOneMiddle]
+    assert cached_verdicts(one_t)[SupportsOneTop]
+
+
+def test_batch_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    from numerary import _protocol
+
+    SupportsOneDerived = _derived_protocol()
+    one_ts = [_one_type() for _ in range(3)]
+    assert all(isinstance(one_t(), SupportsOneDerived) for one_t in one_ts)
+    dirty_for_calls: Counter = Counter()
+    dirty_for = _protocol._dirty_for
+
+    def _counting_dirty_for(inst_t, protocols):
+        dirty_for_calls[inst_t] += 1
+        dirty_for(inst_t, protocols)
+
+    monkeypatch.setattr(_protocol, "_dirty_for", _counting_dirty_for)
+
+    # Nothing takes effect until the outermost block exits
+    with batch_overrides():
+        register_overrides(one_ts, exclude=[SupportsOne])
+
+        with batch_overrides():
+            SupportsOneDerived.excludes(one_ts[0])
+            SupportsOneDerived.reset_for(one_ts[0])
+
+        assert all(isinstance(one_t(), SupportsOneDerived) for one_t in one_ts)
+        assert not dirty_for_calls
+
+    monkeypatch.undo()
+
+    # Invalidation happens once per type
+    assert dirty_for_calls == {one_t: 1 for one_t in one_ts}
+    assert not any(isinstance(one_t(), SupportsOne) for one_t in one_ts)
+    assert not any(isinstance(one_t(), SupportsOneDerived) for one_t in one_ts)
+
+    # Overrides made in a block that raises are discarded
+    with pytest.raises(RuntimeError):
+        with batch_overrides():
+            register_overrides(one_ts[0], include=[SupportsOne])
+
+            raise RuntimeError
+
+    assert not isinstance(one_ts[0](), SupportsOne)
+    register_overrides(one_ts[0], include=[SupportsOneDerived])
+    assert isinstance(one_ts[0](), SupportsOneDerived)
+
+    with pytest.raises(ValueError):
+        register_overrides(one_ts, include=[SupportsOne], exclude=[SupportsOne])
+
+    for one_t in one_ts:
+        SupportsOne.reset_for(one_t)
+        SupportsOneDerived.reset_for(one_t)
+
+    assert all(isinstance(one_t(), SupportsOneDerived) for one_t in one_ts)
+
+
+def test_overriding() -> None:
+    SupportsOneDerived = _derived_protocol()
+
+    @protocoldispatch
+    def which(arg: Any) -> str:
+        return "neither"
+
+    @which.register(SupportsOneDerived)
+    def _(arg: Any) -> str:
+        return "one"
+
+    one_t = _one_type()
+    none_t = type("NoneDerived", (), {})
+    uncounted = CachingProtocolMeta.__dict__["__instancecheck__"]
+    assert isinstance(one_t(), SupportsOneDerived)
+    assert which(one_t()) == "one"
+    verdicts = cached_verdicts(one_t)
+
+    with SupportsOne.overriding(include=[none_t], exclude=[one_t]):
+        assert not isinstance(one_t(), SupportsOne)
+        assert not isinstance(one_t(), SupportsOneDerived)
+        assert isinstance(none_t(), SupportsOneDerived)
+        assert which(one_t()) == "neither"
+        assert which(none_t()) == "one"
+
+        # Innermost overrides apply
+        with SupportsOne.overriding(include=[one_t]):
+            assert isinstance(one_t(), SupportsOneDerived)
+            assert isinstance(none_t(), SupportsOneDerived)
+
+        with SupportsOneDerived.overriding(exclude=[none_t]):
+            assert isinstance(none_t(), SupportsOne)
+            assert not isinstance(none_t(), SupportsOneDerived)
+
+        assert not isinstance(one_t(), SupportsOneDerived)
+
+        # Other threads are unaffected
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(isinstance, one_t(), SupportsOneDerived).result()
+            assert not executor.submit(isinstance, none_t(), SupportsOne).result()
+
+        # The cache is left alone
+        assert cached_verdicts(one_t) == verdicts
+
+    assert isinstance(one_t(), SupportsOneDerived)
+    assert not isinstance(none_t(), SupportsOneDerived)
+    assert which(one_t()) == "one"
+    assert which(none_t()) == "neither"
+    assert CachingProtocolMeta.__dict__["__instancecheck__"] is uncounted
+
+    # Global overrides of deriving protocols still take precedence
+    SupportsOneDerived.includes(one_t)
+
+    with SupportsOne.overriding(exclude=[one_t]):
+        assert isinstance(one_t(), SupportsOneDerived)
+
+    SupportsOneDerived.reset_for(one_t)
+
+    with pytest.raises(ValueError):
+        with SupportsOne.overriding(include=[one_t], exclude=[one_t]):
+            pass
+
+
+def test_overriding_tasks() -> None:
+    one_t = _one_type()
+    uncounted = CachingProtocolMeta.__dict__["__instancecheck__"]
+
+    async def _check() -> bool:
+        await asyncio.sleep(0)
+
+        return isinstance(one_t(), SupportsOne)
+
+    async def _excluded(done: asyncio.Event) -> asyncio.Task:
+        with SupportsOne.overriding(exclude=[one_t]):
+            # Tasks created in the block inherit its overrides, even after it exits
+            task = asyncio.ensure_future(_check())
+            await done.wait()
+
+        return task
+
+    async def _main() -> Tuple[bool, bool, bool]:
+        done = asyncio.Event()
+        excluded = asyncio.ensure_future(_excluded(done))
+        await asyncio.sleep(0)
+        assert CachingProtocolMeta.__dict__["__instancecheck__"] is not uncounted
+        concurrent = isinstance(one_t(), SupportsOne)
+        done.set()
+        task = await excluded
+
+        return concurrent, await task, isinstance(one_t(), SupportsOne)
+
+    concurrent, inherited, after = asyncio.run(_main())
+    assert concurrent
+    assert not inherited
+    assert after
+    gc.collect()
+    assert CachingProtocolMeta.__dict__["__instancecheck__"] is uncounted
+
+
+def test_overriding_released_while_locked() -> None:
+    from contextvars import copy_context
+
+    from numerary import _protocol
+
+    one_t = _one_type()
+    gc.collect()
+    uncounted = CachingProtocolMeta.__dict__["__instancecheck__"]
+
+    with SupportsOne.overriding(exclude=[one_t]):
+        # Keeps the overlay alive after the block exits
+        context = copy_context()
+
+    assert CachingProtocolMeta.__dict__["__instancecheck__"] is not uncounted
+
+    # The overlay's finalizer can't wait for the lock, so the swap back is deferred
+    with _protocol._lock:
+        del context
+
+    assert CachingProtocolMeta.__dict__["__instancecheck__"] is not uncounted
+
+    # The next check completes it
+    assert isinstance(one_t(), SupportsOne)
+    assert CachingProtocolMeta.__dict__["__instancecheck__"] is uncounted
+
+
+def test_component_verdicts() -> None:
+    @runtime_checkable
+    class SupportsTwo(
+        Protocol,
+        metaclass=CachingProtocolMeta,
+    ):
+        @abstractmethod
+        def two(self) -> int:
+            pass
+
+    @runtime_checkable
+    class SupportsOneAndTwo(
+        SupportsOne,
+        Protocol,
+    ):
+        @abstractmethod
+        def two(self) -> int:
+            pass
+
+    # SupportsTwo requires nothing SupportsOneAndTwo doesn't, so it is satisfied
+    # without being checked
+    both_t = type("Both", (One, Two), {})
+    assert isinstance(both_t(), SupportsOneAndTwo)
+    assert cached_verdicts(both_t)[SupportsTwo]
+
+    # Explicit overrides are left alone
+    excluded_t = type("Excluded", (One, Two), {})
+    SupportsTwo.excludes(excluded_t)
+    assert isinstance(excluded_t(), SupportsOneAndTwo)
+    assert not cached_verdicts(excluded_t)[SupportsTwo]
+
+    # Failing SupportsTwo means failing SupportsOneAndTwo without checking SupportsOne
+    one_t = _one_type()
+    assert not isinstance(one_t(), SupportsTwo)
+    assert not isinstance(one_t(), SupportsOneAndTwo)
+    assert cached_verdicts(one_t) == {SupportsTwo: False, SupportsOneAndTwo: False}
+
+    # RationalLike requires everything RealLike does
+    rational_t = type("Rational", (Fraction,), {})
+    assert isinstance(rational_t(), RationalLike)
+    assert cached_verdicts(rational_t)[RealLike]
+
+
+def test_structural_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    import enum
+
+    from numerary import types as numerary_types
+    from numerary._protocol import _BeartypeCachingProtocolMeta
+
+    protocols = [
+        value
+        for value in vars(numerary_types).values()
+        if isinstance(value, CachingProtocolMeta)
+    ]
+
+    class Dynamic:
+        def __getattr__(self, attr_name: str) -> Any:
+            if attr_name in ("__abs__", "__float__", "__int__"):
+                return lambda: 0
+
+            raise AttributeError(attr_name)
+
+    class Blocked(Fraction):
+        __abs__ = None  # type: ignore [assignment]
+        __floor__ = None  # type: ignore [assignment]
+
+    class Raising(float):
+        @property
+        def __round__(self) -> Any:  # type: ignore [override]
+            raise AttributeError("__round__")
+
+    class Enumerated(enum.IntEnum):
+        A = 1
+
+    class Assigned:
+        def __init__(self) -> None:
+            self.__abs__ = lambda: 0
+            self.__float__ = lambda: 0.0
+
+    values: List[Any] = [
+        0,
+        True,
+        -273.15,
+        Fraction(-27315, 100),
+        Decimal("-273.15"),
+        complex(-273.15),
+        "-273.15",
+        None,
+        Enumerated.A,
+        Dynamic(),
+        Blocked(1, 2),
+        Raising(0.5),
+        Assigned(),
+        One(),
+    ]
+
+    numpy = sys.modules.get("numpy")
+
+    if numpy is not None:
+        values.extend((numpy.int64(-273), numpy.float32(-273.15), numpy.bool_(True)))
+
+    # What structural checks amounted to before they were planned in advance, i.e.,
+    # beartype's instance check all the way down (with caches that start out empty
+    # and are discarded afterward)
+    with monkeypatch.context() as m:
+        m.setattr(
+            CachingProtocolMeta,
+            "__instancecheck__",
+            _BeartypeCachingProtocolMeta.__instancecheck__,
+        )
+
+        for protocol in protocols:
+            m.setattr(protocol, "_abc_inst_check_cache", {})
+
+        expected = {
+            (protocol, id(value)): isinstance(value, protocol)
+            for value in values
+            for protocol in protocols
+        }
+
+    for value in values:
+        for protocol in protocols:
+            assert protocol._compute_verdict(value) is expected[protocol, id(value)], (
+                protocol,
+                value,
+            )
+
+
+def test_structural_checks_probe_once() -> None:
+    probes: Counter = Counter()
+
+    class Counted(int):
+        def __getattribute__(self, attr_name: str) -> Any:
+            probes[attr_name] += 1
+
+            return super().__getattribute__(attr_name)
+
+    assert isinstance(Counted(), RealLike)
+    assert isinstance(Counted(), RationalLike)
+    assert isinstance(Counted(), IntegralLike)
+    assert probes
+    assert max(probes.values()) == 1
+
+
+def test_caching_protocol_meta_thread_safety() -> None:
+    @runtime_checkable
+    class SupportsCounted(
+        Protocol,
+        metaclass=CachingProtocolMeta,
+    ):
+        @property
+        @abstractmethod
+        def counted(self) -> int:
+            pass
+
+    lookups: Counter = Counter()
+    lookups_lock = threading.Lock()
+
+    def _counted(self) -> int:
+        with lookups_lock:
+            lookups[type(self)] += 1
+
+        time.sleep(0.001)  # widen the window for racing misses
+
+        return 0
+
+    counted_ts = [
+        type(f"Counted{i}", (), {"counted": property(_counted)}) for i in range(8)
+    ]
+    num_threads = 16
+    barrier = threading.Barrier(num_threads)
+
+    def _check(_: int) -> bool:
+        barrier.wait()
+
+        return all(
+            isinstance(counted_t(), SupportsCounted)
+            for _ in range(50)
+            for counted_t in counted_ts
+        )
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        assert all(executor.map(_check, range(num_threads)))
+
+    # Each structural check was performed exactly once, despite the contention
+    assert lookups == {counted_t: 1 for counted_t in counted_ts}
+
+    toggled_t = counted_ts[0]
+
+    def _toggle(i: int) -> None:
+        barrier.wait()
+
+        for j in range(200):
+            if i % 2:
+                isinstance(toggled_t(), SupportsCounted)
+            elif j % 3 == 0:
+                SupportsCounted.excludes(toggled_t)
+            elif j % 3 == 1:
+                SupportsCounted.includes(toggled_t)
+            else:
+                SupportsCounted.reset_for(toggled_t)
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        list(executor.map(_toggle, range(num_threads)))
+
+    # Whatever the interleaving, the last override wins
+    SupportsCounted.excludes(toggled_t)
+    assert not isinstance(toggled_t(), SupportsCounted)
+    assert not cached_verdicts(toggled_t)[SupportsCounted]
+    SupportsCounted.reset_for(toggled_t)
+    assert isinstance(toggled_t(), SupportsCounted)
+    assert SupportsCounted.cache_info() == CacheInfo(
+        maxsize=None, currsize=len(counted_ts), pinned=0
+    )
+
+
+def test_stats() -> None:
+    SupportsOneDerived = _derived_protocol()
+    one_t = _one_type()
+    set_stats_enabled(True)
+
+    try:
+        assert isinstance(one_t(), SupportsOneDerived)
+        assert isinstance(one_t(), SupportsOneDerived)
+        assert SupportsOneDerived.cache_stats() == {
+            "hits": 1,
+            "misses": 1,
+            "override_hits": 0,
+            "invalidations": 0,
+            "currsize": 1,
+        }
+
+        SupportsOneDerived.includes(Two)
+        assert isinstance(Two(), SupportsOneDerived)
+        SupportsOne.excludes(one_t)
+        assert not isinstance(one_t(), SupportsOneDerived)
+        all_stats = stats(reset=True)
+        assert all_stats[SupportsOneDerived] == {
+            "hits": 2,
+            "misses": 2,
+            "override_hits": 1,
+            "invalidations": 1,
+            "currsize": 2,
+        }
+        assert all_stats[SupportsOne]["override_hits"] == 1
+        assert SupportsOneDerived.cache_stats()["hits"] == 0
+    finally:
+        set_stats_enabled(False)
+        SupportsOne.reset_for(one_t)
+
+    assert isinstance(one_t(), SupportsOneDerived)
+    assert SupportsOneDerived.cache_stats()["misses"] == 0
+
+
+def test_save_load_cached_verdicts(tmp_path: Path) -> None:
+    path = tmp_path / "verdicts.json"
+    local_t = _one_type()
+    assert isinstance(One(), SupportsOne)
+    assert not isinstance(Two(), SupportsOne)
+    assert isinstance(local_t(), SupportsOne)
+    SupportsOne.includes(Three)
+    assert save_cached_verdicts(path) > 0
+
+    with open(path) as f:
+        saved_verdicts = json.load(f)["protocols"][
+            f"{SupportsOne.__module__}:SupportsOne"
+        ]["verdicts"]
+
+    # Neither overrides nor unnameable types are saved
+    assert saved_verdicts == {
+        f"{One.__module__}:One": True,
+        f"{Two.__module__}:Two": False,
+    }
+
+    SupportsOne.reset_for(One)
+    SupportsOne.reset_for(Two)
+    SupportsOne.reset_for(Three)
+    assert SupportsOne not in cached_verdicts(One)
+    assert load_cached_verdicts(path) >= 2
+    assert cached_verdicts(One)[SupportsOne]
+    assert not cached_verdicts(Two)[SupportsOne]
+    assert SupportsOne not in cached_verdicts(Three)
+
+    # Known verdicts take precedence
+    SupportsOne.excludes(One)
+    load_cached_verdicts(path)
+    assert not isinstance(One(), SupportsOne)
+    SupportsOne.reset_for(One)
+
+    # Stale protocols and missing types are skipped
+    with open(path) as f:
+        saved = json.load(f)
+
+    saved["protocols"]["no_such_module:SupportsNothing"] = {
+        "members": "",
+        "verdicts": {f"{One.__module__}:One": False},
+    }
+    saved_protocol = saved["protocols"][f"{SupportsOne.__module__}:SupportsOne"]
+    saved_protocol["verdicts"]["no_such_module:Nothing"] = True
+
+    with open(path, "w") as f:
+        json.dump(saved, f)
+
+    SupportsOne.reset_for(One)
+    assert load_cached_verdicts(path) >= 1
+    assert cached_verdicts(One)[SupportsOne]
+    SupportsOne.reset_for(One)
+    saved_protocol["members"] = "stale"
+
+    with open(path, "w") as f:
+        json.dump(saved, f)
+
+    load_cached_verdicts(path)
+    assert SupportsOne not in cached_verdicts(One)
+    saved["numerary"] = "0.0.0"
+
+    with open(path, "w") as f:
+        json.dump(saved, f)
+
+    assert load_cached_verdicts(path) == 0
+
+
+def test_save_cached_verdicts_threads(tmp_path: Path) -> None:
+    path = tmp_path / "verdicts.json"
+    assert isinstance(One(), SupportsOne)
+
+    # Writers in the same process don't trip over each other's temporary files
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in executor.map(lambda _: save_cached_verdicts(path), range(64)):
+            pass
+
+    assert list(tmp_path.iterdir()) == [path]
+    SupportsOne.reset_for(One)
+    assert load_cached_verdicts(path) > 0
+    assert cached_verdicts(One)[SupportsOne]
+
+
+def test_save_load_cached_verdicts_overridden_bases(tmp_path: Path) -> None:
+    path = tmp_path / "verdicts.json"
+    money_name = f"{Money.__module__}:Money"
+    real_like_name = f"{RealLike.__module__}:RealLike"
+    assert isinstance(Money(1), RealLike)
+    save_cached_verdicts(path)
+    RealLike.reset_for(Money)
+
+    try:
+        # Verdicts saved elsewhere aren't loaded in light of overridden bases...
+        SupportsFloat.excludes(Money)
+        load_cached_verdicts(path)
+        assert RealLike not in cached_verdicts(Money)
+        assert not isinstance(Money(1), RealLike)
+
+        # ...nor are verdicts computed in light of them saved
+        save_cached_verdicts(path)
+
+        with open(path) as f:
+            saved_protocols = json.load(f)["protocols"]
+
+        assert money_name not in saved_protocols[real_like_name]["verdicts"]
+        saved_protocols = snapshot_state()["protocols"]
+        assert money_name not in saved_protocols[real_like_name]["verdicts"]
+        assert money_name not in saved_protocols[real_like_name]["overrides"]
+    finally:
+        SupportsFloat.reset_for(Money)
+
+    assert isinstance(Money(1), RealLike)
+
+
+def test_snapshot_restore_state() -> None:
+    local_t = _one_type()
+    assert isinstance(One(), SupportsOne)
+    assert isinstance(local_t(), SupportsOne)
+    SupportsOne.excludes(Three)
+    SupportsOne.set_cache_maxsize(8)
+
+    try:
+        snapshot = snapshot_state()
+        saved_protocol = snapshot["protocols"][f"{SupportsOne.__module__}:SupportsOne"]
+        assert saved_protocol["verdicts"][f"{One.__module__}:One"]
+        assert not saved_protocol["overrides"][f"{Three.__module__}:Three"]
+        assert saved_protocol["maxsize"] == 8
+        assert snapshot == json.loads(json.dumps(snapshot))
+
+        SupportsOne.reset_for(One)
+        SupportsOne.reset_for(Three)
+        SupportsOne.set_cache_maxsize(None)
+        assert restore_state(snapshot) >= 2
+        assert cached_verdicts(One)[SupportsOne]
+        assert not isinstance(Three(), SupportsOne)
+        assert SupportsOne.cache_info().maxsize == 8
+
+        # Overrides replace known verdicts
+        SupportsOne.includes(Three)
+        restore_state(snapshot)
+        assert not isinstance(Three(), SupportsOne)
+    finally:
+        SupportsOne.reset_for(Three)
+        SupportsOne.set_cache_maxsize(None)
+
+
+def _worker_verdicts() -> Tuple[bool, bool]:
+    return (
+        isinstance(Decimal(1), IntegralLike),
+        SupportsInt in cached_verdicts(Fraction),
+    )
+
+
+def test_worker_initializer() -> None:
+    isinstance(Fraction(1, 2), SupportsInt)
+    IntegralLike.includes(Decimal)
+
+    try:
+        context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            assert executor.submit(_worker_verdicts).result() == (False, False)
+
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=context, **worker_initializer()
+        ) as executor:
+            assert executor.submit(_worker_verdicts).result() == (True, True)
+    finally:
+        IntegralLike.reset_for(Decimal)
+
+
+def test_shared_verdicts(monkeypatch: pytest.MonkeyPatch) -> None:
+    from numerary import _protocol
+
+    SupportsOne.reset_for(One)
+    SupportsOne.reset_for(Two)
+    SupportsOne.reset_for(Three)
+    name = attach_shared_verdicts(slots=64)
+
+    try:
+        if hasattr(os, "fork"):
+            # Verdicts computed by forked workers are visible to us
+            context = multiprocessing.get_context("fork")
+
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                assert executor.submit(isinstance, One(), SupportsOne).result()
+        else:
+            assert isinstance(One(), SupportsOne)
+            SupportsOne._abc_inst_check_cache.pop(One)
+            SupportsOne._record_verdict(One, None)
+
+        # Also by name
+        attach_shared_verdicts(name)
+        assert not isinstance(Two(), SupportsOne)
+        SupportsOne.excludes(Three)
+        assert not isinstance(Three(), SupportsOne)
+        SupportsOne.reset_for(Three)
+
+        def _no_checks(*args: Any) -> bool:
+            raise AssertionError("unexpected check")
+
+        monkeypatch.setattr(_protocol, "_plan_admits", _no_checks)
+        assert SupportsOne not in cached_verdicts(One)
+        assert isinstance(One(), SupportsOne)
+        SupportsOne._abc_inst_check_cache.pop(Two)
+        SupportsOne._record_verdict(Two, None)
+        assert not isinstance(Two(), SupportsOne)
+
+        # Neither overrides nor forgotten verdicts are shared
+        with pytest.raises(AssertionError):
+            isinstance(Three(), SupportsOne)
+
+        SupportsOne.reset_for(Two)
+
+        with pytest.raises(AssertionError):
+            isinstance(Two(), SupportsOne)
+    finally:
+        detach_shared_verdicts(unlink=True)
+        monkeypatch.undo()
+        SupportsOne.reset_for(One)
+        SupportsOne.reset_for(Two)
+        SupportsOne.reset_for(Three)
+
+    with pytest.raises(ValueError):
+        attach_shared_verdicts(slots=0)
+
+
+def _attach_shared_verdicts(name: str, barrier: Any, results: Any) -> None:
+    barrier.wait()
+
+    try:
+        attach_shared_verdicts(name)
+        results.put(None)
+    except Exception as exc:
+        results.put(repr(exc))
+    finally:
+        detach_shared_verdicts()
+
+
+def test_shared_verdicts_concurrent_attach(monkeypatch: pytest.MonkeyPatch) -> None:
+    from multiprocessing import shared_memory
+
+    from numerary import _protocol
+
+    # Segments found before they're sized or have headers are waited for
+    shm = shared_memory.SharedMemory(create=True, size=8 * (2 + 4))
+    buf = shm.buf
+    assert buf is not None
+    attach_shared_memory = _protocol._attach_shared_memory
+    attempts = 0
+
+    def _attach_early(shared_memory: ModuleType, name: str) -> Any:
+        nonlocal attempts
+        attempts += 1
+
+        if attempts == 1:
+            raise ValueError("cannot mmap an empty file")
+        elif attempts == 3:
+            words = buf.cast("Q")
+            words[1] = 4
+            words[0] = _protocol._SHARED_MAGIC
+            words.release()
+
+        return attach_shared_memory(shared_memory, name)
+
+    monkeypatch.setattr(_protocol, "_attach_shared_memory", _attach_early)
+
+    try:
+        assert attach_shared_verdicts(shm.name) == shm.name
+        assert attempts == 3
+        detach_shared_verdicts()
+        monkeypatch.undo()
+
+        # But not forever
+        monkeypatch.setattr(_protocol, "_SHARED_ATTACH_TIMEOUT", 0.01)
+        buf[:8] = bytes(8)
+
+        with pytest.raises(ValueError):
+            attach_shared_verdicts(shm.name)
+    finally:
+        monkeypatch.undo()
+        shm.close()
+        _protocol._unlink_shared_memory(shm, attached=True)
+
+    if not hasattr(os, "fork"):
+        return
+
+    # Workers attaching at once (e.g., in a pool's initializer) all get the same table
+    from multiprocessing import resource_tracker
+
+    resource_tracker.ensure_running()  # share ours with workers
+    context = multiprocessing.get_context("fork")
+    name = f"numerary{os.getpid()}"
+    num_workers = 8
+    barrier = context.Barrier(num_workers)
+    results = context.Queue()
+    workers = [
+        context.Process(target=_attach_shared_verdicts, args=(name, barrier, results))
+        for _ in range(num_workers)
+    ]
+
+    for worker in workers:
+        worker.start()
+
+    try:
+        assert [results.get(timeout=30) for _ in workers] == [None] * num_workers
+    finally:
+        for worker in workers:
+            worker.join()
+
+        attach_shared_verdicts(name)
+        detach_shared_verdicts(unlink=True)
+
+
+def test_when_imported(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "numerary_test_hooked.py").write_text("hooked = True\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    hooked_modules = []
+
+    @when_imported("numerary_test_hooked")
+    def _hook(module: ModuleType) -> None:
+        hooked_modules.append(module)
+
+    assert not hooked_modules
+
+    try:
+        import numerary_test_hooked  # type: ignore [import]
+
+        assert hooked_modules == [numerary_test_hooked]
+        assert numerary_test_hooked.hooked
+
+        # Hooks for modules that were already imported are called immediately
+        when_imported("numerary_test_hooked")(_hook)
+        assert hooked_modules == [numerary_test_hooked, numerary_test_hooked]
+    finally:
+        sys.modules.pop("numerary_test_hooked", None)
+
+
+def test_when_imported_shared_loader(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from importlib.abc import Loader, MetaPathFinder
+    from importlib.machinery import ModuleSpec
+
+    package_dir = tmp_path / "numerary_test_shared"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("from . import sub\n")
+    (package_dir / "sub.txt").write_text("shared = True\n")
+
+    class _SharedLoader(Loader):
+        def exec_module(self, module: ModuleType) -> None:
+            assert module.__spec__ is not None
+            origin = module.__spec__.origin
+            assert origin is not None
+
+            with open(origin) as f:
+                exec(compile(f.read(), origin, "exec"), module.__dict__)
+
+    shared_loader = _SharedLoader()
+
+    class _SharedFinder(MetaPathFinder):
+        # One loader for every module it finds, like those of some freezing tools (the
+        # submodule's source is named so that only we can find it)
+        def find_spec(self, fullname, path, target=None):  # type: ignore
+            parts = fullname.split(".")
+
+            if parts[0] != "numerary_test_shared":
+                return None
+
+            if len(parts) == 1:
+                spec = ModuleSpec(
+                    fullname,
+                    shared_loader,
+                    origin=str(package_dir / "__init__.py"),
+                    is_package=True,
+                )
+                spec.submodule_search_locations = [str(package_dir)]
+            else:
+                spec = ModuleSpec(
+                    fullname, shared_loader, origin=str(package_dir / "sub.txt")
+                )
+
+            return spec
+
+    monkeypatch.setattr(sys, "meta_path", sys.meta_path + [_SharedFinder()])
+    hooked_modules = []
+
+    @when_imported("numerary_test_shared")
+    def _hook(module: ModuleType) -> None:
+        hooked_modules.append(module)
+
+    try:
+        import numerary_test_shared  # type: ignore [import]
+
+        # The hook sees the package (not its submodule), which is otherwise untouched
+        assert hooked_modules == [numerary_test_shared]
+        assert numerary_test_shared.sub.shared
+        assert numerary_test_shared.__loader__ is shared_loader
+        assert numerary_test_shared.__spec__.loader is shared_loader
+        assert "exec_module" not in vars(shared_loader)
+    finally:
+        sys.modules.pop("numerary_test_shared", None)
+        sys.modules.pop("numerary_test_shared.sub", None)
+
+
+def test_lazy_registration() -> None:
+    pytest.importorskip("sympy", reason="requires sympy")
+
+    # numerary shouldn't import sympy on its own, but should still register sympy's
+    # exceptions once it's imported
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from numerary.types import SupportsIntegralOps\n"
+            "assert 'sympy' not in sys.modules\n"
+            "import sympy\n"
+            "assert not isinstance(sympy.Symbol('x'), SupportsIntegralOps)\n",
+        ],
+        check=True,
+    )
+
+
+def test_lazy_registration_in_batch() -> None:
+    pytest.importorskip("numpy", reason="requires numpy")
+
+    # Registrations made when numpy is imported aren't part of the importer's batch
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from numerary.types import SupportsIntegralOps, batch_overrides\n"
+            "try:\n"
+            "  with batch_overrides():\n"
+            "    import numpy\n"
+            "    raise RuntimeError\n"
+            "except RuntimeError:\n"
+            "  pass\n"
+            "assert not isinstance(numpy.float64(0), SupportsIntegralOps)\n",
+        ],
+        check=True,
+    )
+
+
+def test_warm() -> None:
+    # Affirmative verdicts are shared with protocols requiring the same things (see
+    # test_component_verdicts), so make sure any left over from other tests are gone
+    gc.collect()
+
+    SupportsOneDerived = _derived_protocol()
+    one_t = _one_type()
+    info = warm((one_t, Two(), 0.0), (SupportsOne, SupportsOneDerived))
+    assert isinstance(info, WarmInfo)
+    assert info.checked == 6
+    assert info.computed >= 4  # float may already be known
+    assert info.elapsed >= 0.0
+    assert cached_verdicts(one_t) == {SupportsOne: True, SupportsOneDerived: True}
+    assert not cached_verdicts(Two)[SupportsOne]
+    assert not cached_verdicts(Two)[SupportsOneDerived]
+
+    info = warm((one_t,), (SupportsOne, SupportsOneDerived))
+    assert info.checked == 2
+    assert info.computed == 0
+
+    # Defaults to all protocols
+    three_t = type("ThreeDerived", (Three,), {})
+    warm((three_t,))
+    assert cached_verdicts(three_t)[RealLike] is False
+    assert cached_verdicts(three_t)[SupportsOneDerived] is False
+
+    with pytest.raises(TypeError):
+        warm((type("NeedsArgs", (), {"__init__": lambda self, a, b: None}),))
+
+
+def test_check_many() -> None:
+    one_t = _one_type()
+    values = [One(), Two(), one_t(), One(), Three(), one_t()]
+    expected = [isinstance(value, SupportsOne) for value in values]
+    assert expected == [True, False, True, True, False, True]
+    assert SupportsOne.check_many(values) == expected
+    assert SupportsOne.check_many(iter(values)) == expected
+    assert SupportsOne.check_many(()) == []
+    assert not SupportsOne.check_all(values)
+    assert SupportsOne.check_all(v for v in values if not isinstance(v, (Two, Three)))
+    assert SupportsOne.check_all(())
+
+    def _values_then_explode() -> Iterator[object]:
+        yield One()
+        yield Two()
+
+        raise AssertionError("check_all should have stopped")
+
+    assert not SupportsOne.check_all(_values_then_explode())
+
+
+def test_check_many_numpy() -> None:
+    numpy = pytest.importorskip("numpy", reason="requires numpy")
+    values = numpy.array([[One(), Two()], [Three(), One()]], dtype=object)
+    verdicts = SupportsOne.check_many(values)
+    assert isinstance(verdicts, numpy.ndarray)
+    assert verdicts.dtype == bool
+    assert verdicts.tolist() == [[True, False], [False, True]]
+    assert numpy.all(RealLike.check_many(numpy.arange(6).reshape(2, 3)))
+
+
+def test_check_array_numpy() -> None:
+    numpy = pytest.importorskip("numpy", reason="requires numpy")
+
+    for dtype in (numpy.uint8, numpy.int64, numpy.float32, numpy.complex128, "M8[s]"):
+        values = numpy.zeros((3, 2), dtype=dtype)
+
+        for protocol in (IntegralLike, RealLike):
+            expected = isinstance(values[0, 0], protocol)
+            assert protocol.check_array(values) is expected
+            assert protocol.check_array(numpy.dtype(dtype)) is expected
+            assert numpy.array_equal(
+                protocol.check_many(values), numpy.full((3, 2), expected)
+            )
+
+    values = numpy.array([1, numpy.int8(2), 3.0], dtype=object)
+    assert RealLike.check_array(values)
+    assert not IntegralLike.check_array(values)
+    assert IntegralLike.check_array(values[:2])
+    assert IntegralLike.check_array(numpy.array([], dtype=object))
+
+    with pytest.raises(ValueError):
+        RealLike.check_array(numpy.dtype(object))
+
+    with pytest.raises(TypeError):
+        RealLike.check_array([1, 2, 3])
+
+
+def test_protocoldispatch() -> None:
+    @runtime_checkable
+    class SupportsOneTwo(SupportsOne, Protocol, metaclass=CachingProtocolMeta):
+        @abstractmethod
+        def two(self) -> int:
+            pass
+
+    @runtime_checkable
+    class SupportsTwo(Protocol, metaclass=CachingProtocolMeta):
+        @abstractmethod
+        def two(self) -> int:
+            pass
+
+    class OneTwo(One, Two):
+        pass
+
+    @protocoldispatch
+    def which(arg: Any, suffix: str = "") -> str:
+        return "default" + suffix
+
+    @which.register(SupportsOne)
+    def _(arg: Any, suffix: str = "") -> str:
+        return "one" + suffix
+
+    @which.register(SupportsOneTwo)
+    def _(arg: Any, suffix: str = "") -> str:
+        return "one-two" + suffix
+
+    @which.register
+    def _(arg: Three, suffix: str = "") -> str:
+        return "three" + suffix
+
+    assert which(object()) == "default"
+    assert which(One(), suffix="!") == "one!"
+    assert which(OneTwo()) == "one-two"
+    assert which(Three()) == "three"
+    assert which.dispatch(One()) is which.registry[SupportsOne]
+    assert set(which.registry) == {object, SupportsOne, SupportsOneTwo, Three}
+
+    with pytest.raises(TypeError):
+        which()
+
+    # Nominal registrations take precedence over protocols
+    which.register(OneTwo, lambda arg: "one-two-nominal")
+    assert which(OneTwo()) == "one-two-nominal"
+
+    which.register(SupportsTwo, lambda arg: "two")
+    assert which(Two()) == "two"
+    which.register(Three, lambda arg: "three-again")
+    assert which(Three()) == "three-again"
+
+    class OneTwoProtocolOnly:
+        def one(self) -> int:
+            return 1
+
+        def two(self) -> int:
+            return 2
+
+    assert which(OneTwoProtocolOnly()) == "one-two"
+
+    class TwoThree(Two, Three):
+        pass
+
+    assert which(TwoThree()) == "three-again"
+
+    class OneThenTwo:
+        def one(self) -> int:
+            return 1
+
+    class OnlyTwo:
+        def two(self) -> int:
+            return 2
+
+    assert which(OneThenTwo()) == "one"
+    assert which(OnlyTwo()) == "two"
+
+    # Overrides invalidate resolutions
+    try:
+        SupportsOne.includes(OnlyTwo)
+        assert which(OnlyTwo()) == "one-two"
+        SupportsOne.excludes(OneThenTwo)
+        assert which(OneThenTwo()) == "default"
+        SupportsOneTwo.excludes(OnlyTwo)
+
+        # Neither requires everything the other does, so the first registered wins
+        assert which(OnlyTwo()) == "one"
+    finally:
+        SupportsOne.reset_for(OnlyTwo)
+        SupportsOne.reset_for(OneThenTwo)
+        SupportsOneTwo.reset_for(OnlyTwo)
+
+    assert which(OneThenTwo()) == "one"
+    assert which(OnlyTwo()) == "two"
+
+    @runtime_checkable
+    class SupportsThree(Protocol, metaclass=CachingProtocolMeta):
+        @abstractmethod
+        def three(self) -> int:
+            pass
+
+    class TwoAndThree:
+        def two(self) -> int:
+            return 2
+
+        def three(self) -> int:
+            return 3
+
+    which.register(SupportsThree, lambda arg: "three-protocol")
+    assert which(TwoAndThree()) == "two"
+
+    # Registering ABCs works, and their registries are honored
+    class SomeAbc(metaclass=ABCMeta):
+        pass
+
+    which.register(SomeAbc, lambda arg: "abc")
+    assert which(OnlyTwo()) == "two"
+    SomeAbc.register(OnlyTwo)
+    assert which(OnlyTwo()) == "abc"
+
+
+def test_protocoldispatch_real_like() -> None:
+    @protocoldispatch
+    def kind(arg: Any) -> str:
+        return "other"
+
+    # IntegralLike, else RationalLike, else RealLike (IntegralLike and RationalLike
+    # are incomparable, since neither requires everything the other does)
+    kind.register(IntegralLike, lambda arg: "integral")
+    kind.register(RationalLike, lambda arg: "rational")
+    kind.register(RealLike, lambda arg: "real")
+    integrals: List[Any] = [1, True]
+
+    for module_name, t_name in (("numpy", "int64"), ("sympy", "Integer")):
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            continue
+
+        integrals.append(getattr(module, t_name)(1))
+
+    assert [kind(arg) for arg in integrals] == ["integral"] * len(integrals)
+    assert [kind(arg) for arg in (Fraction(1, 2), 1.5, Decimal("1.5"), "1")] == [
+        "rational",
+        "real",
+        "real",
+        "other",
+    ]
+
+    # Otherwise, those registered first take precedence
+    @protocoldispatch
+    def kind_reversed(arg: Any) -> str:
+        return "other"
+
+    kind_reversed.register(RealLike, lambda arg: "real")
+    kind_reversed.register(RationalLike, lambda arg: "rational")
+    kind_reversed.register(IntegralLike, lambda arg: "integral")
+    assert kind_reversed(1) == "rational"
+
+    # But not over those whose member names include all of theirs
+    @runtime_checkable
+    class SupportsIndexDirectly(Protocol, metaclass=CachingProtocolMeta):
+        @abstractmethod
+        def __index__(self) -> int:
+            pass
+
+    @runtime_checkable
+    class SupportsIndexAndMore(SupportsIndex, Protocol):
+        @abstractmethod
+        def more(self) -> None:
+            pass
+
+    class IndexAndMore:
+        def __index__(self) -> int:
+            return 1
+
+        def more(self) -> None:
+            pass
+
+    @protocoldispatch
+    def index_or_more(arg: Any) -> str:
+        return "other"
+
+    index_or_more.register(SupportsIndexDirectly, lambda arg: "index")
+    index_or_more.register(SupportsIndexAndMore, lambda arg: "index-and-more")
+    assert index_or_more(IndexAndMore()) == "index-and-more"
+    assert index_or_more(1) == "index"
+
+
+def test_set_beartype_enabled() -> None:
+    @bt.beartype
+    def scale(val: int, factor: int = 2, *, offset: int = 0) -> int:
+        return val * factor + offset
+
+    def outer() -> Any:
+        @bt.beartype
+        def closure(val: int) -> int:
+            return val * factor
+
+        factor = 2
+
+        return closure
+
+    was_enabled = beartype_enabled()
+
+    try:
+        set_beartype_enabled(False)
+        floor_code = __floor__.__code__
+        floor_sig = inspect.signature(__floor__)
+        assert not beartype_enabled()
+        assert __floor__.__code__ is floor_code
+        assert scale(1) == 2 and scale(1, 3, offset=1) == 4
+        assert scale(0.5) == 1.0  # type: ignore [arg-type]
+        unchecked_closure = outer()
+
+        with pytest.raises(TypeError) as exc_info:
+            __floor__("1.5")  # type: ignore [arg-type]
+
+        assert not isinstance(exc_info.value, BeartypeException)
+
+        with beartype_checking():
+            assert beartype_enabled()
+            assert scale(1) == 2 and scale(1, 3, offset=1) == 4
+            assert __floor__(1.5) == 1
+            assert inspect.signature(__floor__) == floor_sig
+
+            for bad_call in (
+                lambda: __floor__("1.5"),  # type: ignore [arg-type]
+                lambda: scale(0.5),  # type: ignore [arg-type]
+                lambda: scale(1, offset=0.5),  # type: ignore [arg-type]
+            ):
+                with pytest.raises(BeartypeException):
+                    bad_call()
+
+            # Functions with closures can't be switched after the fact
+            assert unchecked_closure(0.5) == 1.0
+
+            with pytest.raises(BeartypeException):
+                outer()(0.5)
+
+            with beartype_checking(False):
+                assert not beartype_enabled()
+                assert scale(0.5) == 1.0  # type: ignore [arg-type]
+
+            assert beartype_enabled()
+
+        assert not beartype_enabled()
+        assert __floor__.__code__ is floor_code
+        assert __floor__.__kwdefaults__ is None
+        assert scale(0.5) == 1.0  # type: ignore [arg-type]
+    finally:
+        set_beartype_enabled(was_enabled)